@@ -80,6 +80,14 @@ setup(
     # Configuration des packages
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"gitmove.ui": ["completions/*"]},
+    
+    # Scripts d'auto-complétion installés là où les shells les cherchent
+    data_files=[
+        ("share/bash-completion/completions", ["src/gitmove/ui/completions/gitmove.bash"]),
+        ("share/zsh/site-functions", ["src/gitmove/ui/completions/_gitmove"]),
+        ("share/fish/vendor_completions.d", ["src/gitmove/ui/completions/gitmove.fish"]),
+    ],
     
     # Configuration des scripts et points d'entrée
     entry_points={
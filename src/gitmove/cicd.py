@@ -7,14 +7,91 @@ Provides comprehensive tools for managing CI/CD workflows across different platf
 import os
 import re
 import sys
+import copy
 import json
-import yaml
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
 import click
 from rich.console import Console
 from rich.table import Table
 
+# TOML parser: stdlib tomllib (3.11+), then the tomli backport, then toml
+try:
+    import tomllib as _toml_lib
+    _TOML_READ_MODE = 'rb'
+except ImportError:
+    try:
+        import tomli as _toml_lib
+        _TOML_READ_MODE = 'rb'
+    except ImportError:
+        try:
+            import toml as _toml_lib
+            _TOML_READ_MODE = 'r'
+        except ImportError:
+            _toml_lib = None
+
+@lru_cache(maxsize=1)
+def get_console() -> Console:
+    """
+    Get the console shared by the CI/CD helpers and commands.
+    
+    Creating a Console probes the terminal, so it is done only once.
+    
+    Returns:
+        Shared rich Console
+    """
+    return Console()
+
+# Static skeleton of the GitHub Actions workflow; the project-specific
+# values (None below) are filled in by _generate_github_actions_workflow
+_GITHUB_ACTIONS_TEMPLATE = {
+    'name': 'GitMove Workflow',
+    'on': {
+        'push': {'branches': ['main', 'develop']},
+        'pull_request': {'branches': ['main', 'develop']}
+    },
+    'jobs': {
+        'build-and-test': {
+            'runs-on': 'ubuntu-latest',
+            'strategy': {
+                'matrix': {
+                    'python-version': None
+                }
+            },
+            'steps': [
+                {'uses': 'actions/checkout@v3'},
+                {
+                    'name': 'Set up Python ${{ matrix.python-version }}',
+                    'uses': 'actions/setup-python@v3',
+                    'with': {'python-version': '${{ matrix.python-version }}'}
+                },
+                {
+                    'name': 'Install dependencies',
+                    'run': '\n'.join([
+                        'python -m pip install --upgrade pip',
+                        'pip install -e ".[dev]"'
+                    ])
+                },
+                {
+                    'name': 'Run linters',
+                    'run': None
+                },
+                {
+                    'name': 'Run tests',
+                    'run': None
+                },
+                {
+                    'name': 'GitMove Branch Validation',
+                    'run': 'gitmove check-conflicts'
+                }
+            ]
+        }
+    }
+}
+_GITHUB_ACTIONS_LINT_STEP = 3
+_GITHUB_ACTIONS_TEST_STEP = 4
+
 class CICDWorkflowGenerator:
     """
     Advanced workflow generator supporting multiple CI/CD platforms.
@@ -28,6 +105,16 @@ class CICDWorkflowGenerator:
         'circleci'
     ]
     
+    __slots__ = (
+        'console',
+        'project_type',
+        'repo_path',
+        'project_details',
+        '_workflow_cache',
+        '_has_pyproject',
+        '_pyproject'
+    )
+    
     def __init__(self, project_type: str = 'python', repo_path: Optional[str] = None):
         """
         Initialize workflow generator.
@@ -36,21 +123,57 @@ class CICDWorkflowGenerator:
             project_type: Type of project (python, js, etc.)
             repo_path: Path to the Git repository
         """
-        self.console = Console()
+        self.console = get_console()
         self.project_type = project_type
         self.repo_path = repo_path or os.getcwd()
+        self._workflow_cache: Dict[str, Dict] = {}
+        # Checked once so detectors skip the file entirely when it is absent
+        self._has_pyproject = os.path.isfile(os.path.join(self.repo_path, 'pyproject.toml'))
+        self._pyproject: Optional[Dict] = None
         self._detect_project_details()
     
     def _detect_project_details(self):
         """
         Detect project-specific details for more accurate workflow generation.
         """
+        python_version = self._detect_python_version()
+        linters = self._detect_linters()
+        
         self.project_details = {
-            'python_version': self._detect_python_version(),
+            'python_version': python_version,
             'dependencies': self._detect_dependencies(),
             'test_command': self._detect_test_command(),
-            'linters': self._detect_linters()
+            'linters': linters,
+            # Derived values shared by every workflow generator
+            'python_version_next': f"{float(python_version) + 0.1}",
+            'lint_command': ' && '.join(
+                f'{linter} .' for linter in linters
+            ) if linters else 'echo "No linters configured"'
         }
+        
+        # Generated workflows depend on the project details
+        self._workflow_cache.clear()
+    
+    def _load_pyproject(self) -> Optional[Dict]:
+        """
+        Parse the repository's pyproject.toml (once per instance).
+        
+        Returns:
+            Parsed pyproject.toml content, or None if it is missing or
+            no TOML library is available
+        """
+        if not self._has_pyproject or _toml_lib is None:
+            return None
+        
+        if self._pyproject is None:
+            try:
+                with open(os.path.join(self.repo_path, 'pyproject.toml'), _TOML_READ_MODE) as f:
+                    self._pyproject = _toml_lib.load(f)
+            except FileNotFoundError:
+                self._has_pyproject = False
+                return None
+        
+        return self._pyproject
     
     def _detect_python_version(self) -> str:
         """
@@ -60,17 +183,13 @@ class CICDWorkflowGenerator:
             Detected Python version
         """
         # Check pyproject.toml
-        try:
-            import toml
-            with open(os.path.join(self.repo_path, 'pyproject.toml'), 'r') as f:
-                config = toml.load(f)
-                requires_python = config.get('project', {}).get('requires-python', '')
-                if requires_python:
-                    # Extract version
-                    match = re.search(r'(\d+\.\d+)', requires_python)
-                    return match.group(1) if match else '3.8'
-        except (ImportError, FileNotFoundError):
-            pass
+        config = self._load_pyproject()
+        if config is not None:
+            requires_python = config.get('project', {}).get('requires-python', '')
+            if requires_python:
+                # Extract version
+                match = re.search(r'(\d+\.\d+)', requires_python)
+                return match.group(1) if match else '3.8'
         
         # Check runtime.txt (Heroku style)
         try:
@@ -93,13 +212,9 @@ class CICDWorkflowGenerator:
         dependencies = []
         
         # Check pyproject.toml
-        try:
-            import toml
-            with open(os.path.join(self.repo_path, 'pyproject.toml'), 'r') as f:
-                config = toml.load(f)
-                dependencies = config.get('project', {}).get('dependencies', [])
-        except (ImportError, FileNotFoundError):
-            pass
+        config = self._load_pyproject()
+        if config is not None:
+            dependencies = config.get('project', {}).get('dependencies', [])
         
         # Fallback to requirements.txt
         if not dependencies:
@@ -140,7 +255,7 @@ class CICDWorkflowGenerator:
         # Check for common linting tools
         if os.path.exists(os.path.join(self.repo_path, '.flake8')):
             linters.append('flake8')
-        if os.path.exists(os.path.join(self.repo_path, 'pyproject.toml')) and 'black' in self._detect_dependencies():
+        if self._has_pyproject and 'black' in self._detect_dependencies():
             linters.append('black')
         if os.path.exists(os.path.join(self.repo_path, '.mypy.ini')):
             linters.append('mypy')
@@ -169,7 +284,14 @@ class CICDWorkflowGenerator:
             'circleci': self._generate_circleci_workflow
         }
         
-        return workflow_generators[platform]()
+        # Serve previously generated workflows from the cache; callers get a
+        # copy so they can mutate the result freely
+        workflow = self._workflow_cache.get(platform)
+        if workflow is None:
+            workflow = workflow_generators[platform]()
+            self._workflow_cache[platform] = workflow
+        
+        return copy.deepcopy(workflow)
     
     def _generate_github_actions_workflow(self) -> Dict:
         """
@@ -178,55 +300,18 @@ class CICDWorkflowGenerator:
         Returns:
             GitHub Actions workflow configuration
         """
-        return {
-            'name': 'GitMove Workflow',
-            'on': {
-                'push': {'branches': ['main', 'develop']},
-                'pull_request': {'branches': ['main', 'develop']}
-            },
-            'jobs': {
-                'build-and-test': {
-                    'runs-on': 'ubuntu-latest',
-                    'strategy': {
-                        'matrix': {
-                            'python-version': [
-                                self.project_details['python_version'],
-                                f"{float(self.project_details['python_version']) + 0.1}"
-                            ]
-                        }
-                    },
-                    'steps': [
-                        {'uses': 'actions/checkout@v3'},
-                        {
-                            'name': 'Set up Python ${{ matrix.python-version }}',
-                            'uses': 'actions/setup-python@v3',
-                            'with': {'python-version': '${{ matrix.python-version }}'}
-                        },
-                        {
-                            'name': 'Install dependencies',
-                            'run': '\n'.join([
-                                'python -m pip install --upgrade pip',
-                                'pip install -e ".[dev]"'
-                            ])
-                        },
-                        {
-                            'name': 'Run linters',
-                            'run': ' && '.join([
-                                f'{linter} .' for linter in self.project_details['linters']
-                            ]) if self.project_details['linters'] else 'echo "No linters configured"'
-                        },
-                        {
-                            'name': 'Run tests',
-                            'run': self.project_details['test_command']
-                        },
-                        {
-                            'name': 'GitMove Branch Validation',
-                            'run': 'gitmove check-conflicts'
-                        }
-                    ]
-                }
-            }
-        }
+        workflow = copy.deepcopy(_GITHUB_ACTIONS_TEMPLATE)
+        job = workflow['jobs']['build-and-test']
+        job['strategy']['matrix']['python-version'] = [
+            self.project_details['python_version'],
+            self.project_details['python_version_next']
+        ]
+        
+        steps = job['steps']
+        steps[_GITHUB_ACTIONS_LINT_STEP]['run'] = self.project_details['lint_command']
+        steps[_GITHUB_ACTIONS_TEST_STEP]['run'] = self.project_details['test_command']
+        
+        return workflow
     
     def _generate_gitlab_ci_workflow(self) -> Dict:
         """
@@ -246,9 +331,7 @@ class CICDWorkflowGenerator:
             },
             'lint': {
                 'script': [
-                    ' && '.join([
-                        f'{linter} .' for linter in self.project_details['linters']
-                    ]) if self.project_details['linters'] else 'echo "No linters configured"'
+                    self.project_details['lint_command']
                 ]
             },
             'validate': {
@@ -277,9 +360,7 @@ class CICDWorkflowGenerator:
                     {
                         'stage': 'Lint',
                         'steps': [
-                            ' && '.join([
-                                f'{linter} .' for linter in self.project_details['linters']
-                            ]) if self.project_details['linters'] else 'echo "No linters configured"'
+                            self.project_details['lint_command']
                         ]
                     },
                     {
@@ -305,14 +386,14 @@ class CICDWorkflowGenerator:
             'language': 'python',
             'python': [
                 self.project_details['python_version'],
-                f"{float(self.project_details['python_version']) + 0.1}"
+                self.project_details['python_version_next']
             ],
             'install': [
                 'pip install -e ".[dev]"'
             ],
             'script': [
-                *([' && '.join([f'{linter} .' for linter in self.project_details['linters']])
-                   ] if self.project_details['linters'] else []),
+                *([self.project_details['lint_command']]
+                  if self.project_details['linters'] else []),
                 self.project_details['test_command'],
                 'gitmove check-conflicts'
             ]
@@ -343,7 +424,7 @@ class CICDWorkflowGenerator:
                         *([{
                             'run': {
                                 'name': 'Run linters',
-                                'command': ' && '.join([f'{linter} .' for linter in self.project_details['linters']])
+                                'command': self.project_details['lint_command']
                             }
                         }] if self.project_details['linters'] else []),
                         {
@@ -369,6 +450,9 @@ class CICDWorkflowGenerator:
             }
         }
 
+# Long-lived branches that are always valid
+_MAIN_BRANCHES = frozenset({'main', 'master', 'develop'})
+
 class BranchValidator:
     """
     Advanced branch validation and naming convention checker.
@@ -384,6 +468,9 @@ class BranchValidator:
         'test': r'^test/([\w-]+)$'
     }
     
+    # Only classmethods: instances carry no state
+    __slots__ = ()
+    
     @classmethod
     def validate_branch_name(
         cls, 
@@ -403,7 +490,7 @@ class BranchValidator:
         patterns = patterns or cls.DEFAULT_PATTERNS
         
         # Special cases for main branches
-        if branch_name in ['main', 'master', 'develop']:
+        if branch_name in _MAIN_BRANCHES:
             return {
                 'is_valid': True,
                 'type': 'main',
@@ -448,7 +535,7 @@ def register_cicd_commands(cli):
     @click.option('--output', '-o', type=click.Path(), help='Output path for workflow file')
     def generate_workflow(platform, output):
         """Generate CI/CD workflow configuration."""
-        console = Console()
+        console = get_console()
         generator = CICDWorkflowGenerator()
         
         try:
@@ -479,8 +566,12 @@ def register_cicd_commands(cli):
             
             # Write workflow configuration
             if output_format == 'yaml':
+                # PyYAML is only needed here: import it on demand
+                import yaml
+                # libyaml-backed dumper when PyYAML was built with it
+                dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
                 with open(output_path, 'w') as f:
-                    yaml.dump(workflow, f, default_flow_style=False)
+                    yaml.dump(workflow, f, Dumper=dumper, default_flow_style=False)
             else:
                 with open(output_path, 'w') as f:
                     json.dump(workflow, f, indent=2)
@@ -495,7 +586,7 @@ def register_cicd_commands(cli):
     @click.argument('branch_name')
     def validate_branch(branch_name):
         """Validate branch name against naming conventions."""
-        console = Console()
+        console = get_console()
         validator = BranchValidator()
         
         result = validator.validate_branch_name(branch_name)
@@ -519,7 +610,7 @@ def register_cicd_commands(cli):
     @click.option('--output', '-o', type=click.Path(), help='Output path for the report')
     def workflow_report(output):
         """Generate a comprehensive workflow readiness report."""
-        console = Console()
+        console = get_console()
         generator = CICDWorkflowGenerator()
         
         # Generate reports for all supported platforms
@@ -551,6 +642,17 @@ def register_cicd_commands(cli):
             console.print(json.dumps(report, indent=2))
 
 # Utility functions
+_CI_ENV_VARS = {
+    'github_actions': 'GITHUB_ACTIONS',
+    'gitlab_ci': 'GITLAB_CI',
+    'travis_ci': 'TRAVIS',
+    'circleci': 'CIRCLECI',
+    'jenkins': 'JENKINS_HOME',
+    'azure_pipelines': 'SYSTEM_TEAMFOUNDATIONCOLLECTIONURI',
+    'bitbucket_pipelines': 'BITBUCKET_COMMIT'
+}
+_CI_ENV_VAR_NAMES = frozenset(_CI_ENV_VARS.values())
+
 def detect_ci_environment() -> Optional[Dict]:
     """
     Detect the current CI/CD environment.
@@ -558,24 +660,25 @@ def detect_ci_environment() -> Optional[Dict]:
     Returns:
         Dictionary with CI environment details or None
     """
-    ci_env_vars = {
-        'github_actions': 'GITHUB_ACTIONS',
-        'gitlab_ci': 'GITLAB_CI',
-        'travis_ci': 'TRAVIS',
-        'circleci': 'CIRCLECI',
-        'jenkins': 'JENKINS_HOME',
-        'azure_pipelines': 'SYSTEM_TEAMFOUNDATIONCOLLECTIONURI',
-        'bitbucket_pipelines': 'BITBUCKET_COMMIT'
-    }
+    environ = os.environ
+    present = environ.keys() & _CI_ENV_VAR_NAMES
+    if not present:
+        return None
     
-    detected_ci = {}
-    for name, var in ci_env_vars.items():
-        if os.environ.get(var):
-            detected_ci[name] = {
-                'environment': name,
-                'branch': os.environ.get('BRANCH_NAME', 'unknown'),
-                'commit': os.environ.get('COMMIT', 'unknown')
-            }
+    # Branch and commit are shared by every detected CI
+    branch = environ.get('BRANCH_NAME', 'unknown')
+    commit = environ.get('COMMIT', 'unknown')
+    
+    # Built in declaration order, not in the (hash-dependent) set order
+    detected_ci = {
+        name: {
+            'environment': name,
+            'branch': branch,
+            'commit': commit
+        }
+        for name, var in _CI_ENV_VARS.items()
+        if var in present and environ[var]
+    }
     
     return detected_ci or None
 
@@ -589,7 +692,7 @@ def generate_ci_config(cli):
     @cli.command('detect-ci')
     def detect_ci():
         """Detect current CI/CD environment."""
-        console = Console()
+        console = get_console()
         ci_env = detect_ci_environment()
         
         if ci_env:
@@ -607,6 +710,8 @@ class CICDWorkflowHandler:
     Advanced handler for CI/CD specific workflow operations.
     """
     
+    __slots__ = ('repo_path', 'ci_env')
+    
     def __init__(self, repo_path: Optional[str] = None):
         """
         Initialize CICD Workflow Handler.
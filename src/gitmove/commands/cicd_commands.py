@@ -9,13 +9,13 @@ import os
 import sys
 import json
 import click
-from rich.console import Console
 from rich.table import Table
 
 from gitmove.cicd import (
     CICDWorkflowGenerator, 
     BranchValidator, 
-    detect_ci_environment
+    detect_ci_environment,
+    get_console
 )
 
 def register_cicd_commands(cli):
@@ -40,7 +40,7 @@ def register_cicd_commands(cli):
     @click.option('--output', '-o', type=click.Path(), help='Output path for workflow file')
     def generate_workflow(platform, output):
         """Generate CI/CD workflow configuration."""
-        console = Console()
+        console = get_console()
         generator = CICDWorkflowGenerator()
         
         try:
@@ -72,8 +72,10 @@ def register_cicd_commands(cli):
             # Write workflow configuration
             if output_format == 'yaml':
                 import yaml
+                # libyaml-backed dumper when PyYAML was built with it
+                dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
                 with open(output_path, 'w') as f:
-                    yaml.dump(workflow, f, default_flow_style=False)
+                    yaml.dump(workflow, f, Dumper=dumper, default_flow_style=False)
             else:
                 with open(output_path, 'w') as f:
                     json.dump(workflow, f, indent=2)
@@ -88,7 +90,7 @@ def register_cicd_commands(cli):
     @click.argument('branch_name')
     def validate_branch(branch_name):
         """Validate branch name against naming conventions."""
-        console = Console()
+        console = get_console()
         validator = BranchValidator()
         
         result = validator.validate_branch_name(branch_name)
@@ -112,7 +114,7 @@ def register_cicd_commands(cli):
     @click.option('--output', '-o', type=click.Path(), help='Output path for the report')
     def workflow_report(output):
         """Generate a comprehensive workflow readiness report."""
-        console = Console()
+        console = get_console()
         generator = CICDWorkflowGenerator()
         
         # Generate reports for all supported platforms
@@ -155,7 +157,7 @@ def generate_ci_config(cli):
     @cli.command('detect-ci')
     def detect_ci():
         """Detect current CI/CD environment."""
-        console = Console()
+        console = get_console()
         ci_env = detect_ci_environment()
         
         if ci_env:
@@ -59,16 +59,18 @@ def register_env_config_commands(cli):
     @env.command('list')
     def list_env_vars():
         """List all GitMove-related environment variables."""
-        gitmove_vars = {
-            key: value for key, value in os.environ.items() 
-            if key.startswith(EnvConfigLoader.ENV_PREFIX)
-        }
+        prefix = EnvConfigLoader.ENV_PREFIX
+        gitmove_vars = sorted(
+            (key, value) for key, value in os.environ.items()
+            if key.startswith(prefix)
+        )
         
         if not gitmove_vars:
             click.echo("No GitMove-related environment variables found.")
         else:
-            click.echo("GitMove Environment Variables:")
-            for key, value in sorted(gitmove_vars.items()):
-                click.echo(f"{key}: {value}")
+            # Write the whole listing at once rather than one echo per variable
+            lines = ["GitMove Environment Variables:"]
+            lines.extend(f"{key}: {value}" for key, value in gitmove_vars)
+            click.echo("\n".join(lines))
                 
     return env  # Return the group for use in other modules
\ No newline at end of file
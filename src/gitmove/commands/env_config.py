@@ -10,10 +10,22 @@ Provides comprehensive environment variable configuration management with:
 
 import os
 import re
-import json
 import typing
 from typing import Any, Dict, List, Optional, Union
 
+# orjson parses noticeably faster than json when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Opening and closing characters of a JSON object or array value
+_JSON_BRACKETS = frozenset(('{}', '[]'))
+
+# Boolean spellings, checked with a single hash lookup each
+_BOOL_TRUE = frozenset(('true', '1', 'yes', 'on'))
+_BOOL_FALSE = frozenset(('false', '0', 'no', 'off'))
+
 class EnvConfigLoader:
     """
     Advanced environment variable configuration loader for GitMove.
@@ -25,6 +37,9 @@ class EnvConfigLoader:
     # Prefix for GitMove-specific environment variables
     ENV_PREFIX = "GITMOVE_"
     
+    # Rendered environment templates, by prefix
+    _template_cache: Dict[str, str] = {}
+    
     @classmethod
     def load_config(
         cls, 
@@ -43,11 +58,20 @@ class EnvConfigLoader:
         """
         config = base_config.copy() if base_config else {}
         prefix = prefix or cls.ENV_PREFIX
+        prefix_len = len(prefix)
         
-        for key, value in os.environ.items():
-            if key.startswith(prefix):
-                config_key = key[len(prefix):].lower()
-                config = cls._merge_config_value(config, config_key, value)
+        # Single scan of the environment for the prefixed variables
+        items = [
+            (key[prefix_len:].lower(), value)
+            for key, value in os.environ.items()
+            if key.startswith(prefix)
+        ]
+        
+        # Merge every value into the one configuration copy; sections coming
+        # from base_config are copied the first time they are written to
+        copied_sections = set()
+        for config_key, value in items:
+            cls._merge_config_value(config, config_key, value, copied_sections)
         
         return config
         
@@ -74,41 +98,42 @@ class EnvConfigLoader:
         # return config
     
     @classmethod
-    def _merge_config_value(cls, config: Dict, key: str, value: str) -> Dict:
+    def _merge_config_value(
+        cls,
+        config: Dict,
+        key: str,
+        value: str,
+        copied_sections: Optional[set] = None
+    ) -> Dict:
         """
         Merge a configuration value into the existing configuration.
         
+        The configuration is updated in place. A section is copied before
+        it is first written to, so that sections shared with the caller's
+        base configuration are left untouched.
+        
         Args:
-            config: Existing configuration dictionary
+            config: Existing configuration dictionary (updated in place)
             key: Configuration key (potentially nested)
             value: Configuration value
+            copied_sections: Sections already copied into ``config``
+                (updated with the section written to)
         
         Returns:
-            Updated configuration dictionary
+            Updated configuration dictionary (the same object as ``config``)
         """
-        # Create a copy to avoid modifying the original
-        config = config.copy()
-        
-        # Split nested keys
-        parts = key.split('_')
-        
-        # Handle standard dot notation conversion (all lowercase)
-        if len(parts) >= 2:
-            section = parts[0]
-            subsection = '_'.join(parts[1:]) if len(parts) > 2 else parts[1]
-            
-            if section not in config:
-                config[section] = {}
-            
-            if not isinstance(config[section], dict):
-                config[section] = {}
-                
-            # Convert value
-            converted_value = cls._convert_value(value)
-            config[section][subsection] = converted_value
-        else:
+        section, separator, subsection = key.partition('_')
+        if not separator:
             # Single level key
             config[key] = cls._convert_value(value)
+            return config
+        
+        if copied_sections is None or section not in copied_sections:
+            existing = config.get(section)
+            config[section] = existing.copy() if isinstance(existing, dict) else {}
+            if copied_sections is not None:
+                copied_sections.add(section)
+        config[section][subsection] = cls._convert_value(value)
         
         return config
     
@@ -127,18 +152,17 @@ class EnvConfigLoader:
             return value
             
         # Try JSON parsing first (for complex types)
-        if (value.startswith('{') and value.endswith('}')) or \
-           (value.startswith('[') and value.endswith(']')):
+        if value[0] + value[-1] in _JSON_BRACKETS:
             try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
+                return _json_loads(value)
+            except (ValueError, TypeError):
                 pass
         
         # Boolean conversion
         value_lower = value.lower()
-        if value_lower in ['true', '1', 'yes', 'on']:
+        if value_lower in _BOOL_TRUE:
             return True
-        if value_lower in ['false', '0', 'no', 'off']:
+        if value_lower in _BOOL_FALSE:
             return False
         
         # Numeric conversion
@@ -160,6 +184,11 @@ class EnvConfigLoader:
         Returns:
             String containing environment variable examples
         """
+        # The template only depends on the prefix: render it once per prefix
+        cached = cls._template_cache.get(cls.ENV_PREFIX)
+        if cached is not None:
+            return cached
+        
         template = [
             "# GitMove Configuration Environment Variables",
             "",
@@ -180,7 +209,9 @@ class EnvConfigLoader:
             f"{cls.ENV_PREFIX}COMPLEX_CONFIG={{\"key\":\"value\",\"nested\":{{\"array\":[1,2,3]}}}}"
         ]
         
-        return "\n".join(template)
+        rendered = "\n".join(template)
+        cls._template_cache[cls.ENV_PREFIX] = rendered
+        return rendered
     
     @classmethod
     def validate_env_config(
@@ -255,7 +286,7 @@ class EnvConfigLoader:
                                     elif expected_type == str:
                                         value = str(value)
                                     elif expected_type == bool and isinstance(value, str):
-                                        value = value.lower() in ('true', 'yes', '1', 'on')
+                                        value = value.lower() in _BOOL_TRUE
                                     elif expected_type == list and isinstance(value, str):
                                         value = [item.strip() for item in value.split(",")]
                                 except (ValueError, TypeError):
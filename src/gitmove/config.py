@@ -9,6 +9,15 @@ from typing import Any, Dict, List, Optional, Union
 
 import toml
 
+# Lecture TOML : tomllib (3.11+) ou son rétroportage tomli, plus rapides que
+# toml et qui lisent le fichier en binaire ; toml reste utilisé pour l'écriture
+try:
+    import tomllib as _toml_reader
+except ImportError:
+    try:
+        import tomli as _toml_reader
+    except ImportError:
+        _toml_reader = None
 
 
 # Configuration par défaut
@@ -68,29 +77,33 @@ class Config:
         """
         config = cls()
         
-        # 1. Charger la configuration globale
-        global_config = cls._get_global_config_path()
-        if global_config.exists():
-            config.load_from_file(global_config)
+        # 1. Charger la configuration globale (un fichier absent est ignoré)
+        try:
+            config.load_from_file(cls._get_global_config_path())
+        except FileNotFoundError:
+            pass
         
         # 2. Charger la configuration du projet
         if repo_path:
             repo_config = cls._get_repo_config_path(repo_path)
-            if repo_config.exists():
+            try:
                 config.load_from_file(repo_config)
                 config.config_path = str(repo_config)
+            except FileNotFoundError:
+                pass
         
         # 3. Fusionner avec les variables d'environnement
         # Import ici pour éviter les importations circulaires
         from gitmove.env_config import EnvConfigManager
-        env_config = EnvConfigManager.load_config(config.config)
-        config.config.update(env_config)
+        # load_config renvoie déjà une copie complète de la configuration,
+        # enrichie des variables : elle la remplace sans recopie
+        config.config = EnvConfigManager.load_config(config.config)
         
         # 4. Valider la configuration finale
         try:
             # Import ici pour éviter les importations circulaires
-            from gitmove.validators.config_validator import ConfigValidator
-            validator = ConfigValidator()
+            from gitmove.env_config import _get_validator
+            validator = _get_validator()
             config.config = validator.validate_config(config.config)
         except ValueError as e:
             print(f"Erreur de configuration : {e}")
@@ -105,12 +118,25 @@ class Config:
             path: Chemin vers le fichier de configuration.
         """
         path = Path(path)
-        if not path.exists():
+        
+        # Ouvrir directement le fichier : pas de vérification d'existence
+        # préalable, l'ouverture échoue d'elle-même s'il est absent
+        try:
+            if _toml_reader is not None:
+                f = open(path, "rb")
+            else:
+                f = open(path, "r", encoding="utf-8")
+        except FileNotFoundError:
             raise FileNotFoundError(f"Le fichier de configuration {path} n'existe pas.")
+        except OSError as e:
+            raise Exception(f"Erreur lors de la lecture du fichier de configuration: {str(e)}")
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                file_config = toml.load(f)
+            with f:
+                if _toml_reader is not None:
+                    file_config = _toml_reader.load(f)
+                else:
+                    file_config = toml.load(f)
             
             # Fusionner la configuration du fichier avec l'existante
             self._merge_config(file_config)
@@ -193,30 +219,33 @@ class Config:
     
     def _merge_config(self, new_config: Dict):
         """
-        Fusionne une nouvelle configuration avec l'existante de façon récursive.
+        Fusionne une nouvelle configuration avec l'existante en profondeur.
         
         Args:
             new_config: Nouvelle configuration à fusionner
         """
-        for key, value in new_config.items():
-            if key in self.config and isinstance(self.config[key], dict) and isinstance(value, dict):
-                self._merge_config_section(self.config[key], value)
-            else:
-                self.config[key] = value
+        self._merge_config_section(self.config, new_config)
     
     def _merge_config_section(self, target: Dict, source: Dict):
         """
-        Fusionne une section de configuration de façon récursive.
+        Fusionne une section de configuration en profondeur.
+        
+        Les sous-sections sont parcourues avec une pile plutôt que par appels
+        récursifs (pas de limite de profondeur).
         
         Args:
-            target: Section cible
+            target: Section cible (modifiée en place)
             source: Section source
         """
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._merge_config_section(target[key], value)
-            else:
-                target[key] = value
+        stack = [(target, source)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
     
     @staticmethod
     def _get_global_config_path() -> Path:
@@ -254,8 +283,8 @@ class Config:
             Liste des problèmes trouvés. Liste vide si tout est valide.
         """
         # Import ici pour éviter les importations circulaires
-        from gitmove.validators.config_validator import ConfigValidator
-        validator = ConfigValidator()
+        from gitmove.env_config import _get_validator
+        validator = _get_validator()
         
         try:
             # Utiliser le validateur consolidé
@@ -303,8 +332,8 @@ class Config:
             Dictionnaire de recommandations
         """
         # Import ici pour éviter les importations circulaires
-        from gitmove.validators.config_validator import ConfigValidator
-        validator = ConfigValidator()
+        from gitmove.env_config import _get_validator
+        validator = _get_validator()
         return validator.recommend_configuration(self.config)
     
     def generate_sample_config(self, output_path: Optional[str] = None) -> str:
@@ -318,6 +347,6 @@ class Config:
             Contenu de la configuration d'exemple
         """
         # Import ici pour éviter les importations circulaires
-        from gitmove.validators.config_validator import ConfigValidator
-        validator = ConfigValidator()
+        from gitmove.env_config import _get_validator
+        validator = _get_validator()
         return validator.generate_sample_config(output_path)
\ No newline at end of file
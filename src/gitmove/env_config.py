@@ -10,9 +10,63 @@ Provides comprehensive environment variable configuration management with:
 
 import os
 import re
-import json
 import typing
-from typing import Any, Dict, List, Optional, Union
+from collections.abc import Mapping
+from sys import intern
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# orjson est nettement plus rapide que json lorsqu'il est disponible
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Premiers caractères possibles pour chaque type de valeur convertie
+_JSON_STARTS = frozenset('{[')
+_NUMBER_STARTS = frozenset('0123456789+-. \t')
+_BOOL_TRUE = frozenset(('true', '1', 'yes', 'on'))
+_BOOL_FALSE = frozenset(('false', '0', 'no', 'off'))
+
+
+def _freeze(mapping: Dict) -> Mapping:
+    """
+    Rendre un schéma imbriqué non modifiable.
+    
+    Args:
+        mapping: Dictionnaire (éventuellement imbriqué) à figer
+    
+    Returns:
+        Vue en lecture seule du dictionnaire et de ses sous-dictionnaires
+    """
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    })
+
+
+class _CompiledRule:
+    """
+    Règle de validation compilée d'une clé de configuration.
+    """
+    
+    __slots__ = ('type', 'pattern_re', 'allowed', 'allowed_values', 'description', 'example')
+    
+    def __init__(self, rules: Mapping):
+        """
+        Args:
+            rules: Règles de la clé dans le schéma de validation
+        """
+        pattern = rules.get('pattern')
+        allowed = rules.get('allowed')
+        
+        self.type = rules.get('type')
+        self.pattern_re = re.compile(pattern) if pattern is not None else None
+        self.allowed = frozenset(allowed) if allowed is not None else None
+        # Valeurs autorisées telles qu'écrites dans le schéma (pour les messages)
+        self.allowed_values = allowed
+        self.description = rules.get('description', '')
+        self.example = rules.get('example', '')
 
 
 class EnvConfigManager:
@@ -25,21 +79,90 @@ class EnvConfigManager:
     # Prefix for GitMove-specific environment variables
     ENV_PREFIX = "GITMOVE_"
     
+    # Default validation schema (read-only)
+    _DEFAULT_VALIDATION_SCHEMA = _freeze({
+        'general': {
+            'main_branch': {
+                'type': str,
+                'pattern': r'^[a-zA-Z0-9_\-./]+$',
+                'default': 'main'
+            },
+            'verbose': {
+                'type': bool,
+                'default': False
+            }
+        },
+        'sync': {
+            'default_strategy': {
+                'type': str,
+                'allowed': ['merge', 'rebase', 'auto'],
+                'default': 'rebase'
+            },
+            'auto_sync': {
+                'type': bool,
+                'default': True
+            }
+        }
+    })
+    
+    # Default environment template schema (read-only)
+    _DEFAULT_TEMPLATE_SCHEMA = _freeze({
+        'general': {
+            'main_branch': {
+                'type': 'string',
+                'description': 'Default main branch name',
+                'example': 'main'
+            },
+            'verbose': {
+                'type': 'boolean',
+                'description': 'Enable verbose logging',
+                'example': 'false'
+            }
+        },
+        'sync': {
+            'default_strategy': {
+                'type': 'string',
+                'description': 'Default sync strategy',
+                'example': 'rebase'
+            },
+            'auto_sync': {
+                'type': 'boolean',
+                'description': 'Enable automatic synchronization',
+                'example': 'true'
+            }
+        }
+    })
+    
+    # Schémas de validation compilés :
+    # {id(schema): (schema, schéma compilé, vue à plat du schéma compilé)}
+    _schema_cache: Dict[int, Tuple[Dict, Dict, Dict]] = {}
+    _SCHEMA_CACHE_SIZE = 32
+    
+    # Validateur généré pour le schéma par défaut (voir _compile_validator)
+    _default_validator: typing.Callable[[Dict], Dict[str, List[str]]]
+    
+    # Valeurs extraites de l'environnement, par préfixe :
+    # {préfixe: (variables correspondantes, configuration extraite)}
+    _cache: Dict[str, Tuple[Tuple[Tuple[str, str], ...], Dict]] = {}
+    
     @classmethod
     def load_config(
         cls, 
         base_config: Optional[Dict] = None, 
-        prefix: Optional[str] = None
-    ) -> Dict:
+        prefix: Optional[str] = None,
+        with_flat: bool = False
+    ) -> Union[Dict, Tuple[Dict, Dict]]:
         """
         Charger la configuration à partir des variables d'environnement.
         
         Args:
             base_config: Configuration de base à enrichir
             prefix: Préfixe pour les variables d'environnement (par défaut: GITMOVE_)
+            with_flat: Retourner aussi une vue à plat de la configuration
         
         Returns:
-            Configuration enrichie
+            Configuration enrichie, ou tuple (configuration, vue à plat
+            ``{"section.cle": valeur}``) si ``with_flat`` est vrai
         """
         # Copier la configuration de base pour ne pas la modifier
         config = {}
@@ -57,66 +180,170 @@ class EnvConfigManager:
         # Utiliser le préfixe spécifié ou celui par défaut
         env_prefix = prefix or cls.ENV_PREFIX
         
-        # Parcourir les variables d'environnement
-        for key, value in os.environ.items():
-            if key.startswith(env_prefix):
-                # Extraire la clé de configuration (sans le préfixe)
-                config_key = key[len(env_prefix):]
-                # Fusionner la valeur dans la configuration
-                config = cls._merge_config_value(config, config_key, value)
+        # Relever les variables d'environnement concernées (clés sans préfixe)
+        env_items = tuple(sorted(cls._iter_env_vars(env_prefix)))
+        
+        # Cas courant : aucune variable ne porte le préfixe, il n'y a rien
+        # à fusionner (ni cache à consulter)
+        if not env_items:
+            if with_flat:
+                return config, cls._flatten_config(config)
+            return config
+        
+        # Ne reconvertir les valeurs que si l'environnement a changé
+        cached = cls._cache.get(env_prefix)
+        if cached is None or cached[0] != env_items:
+            merge = cls._merge_config_value
+            env_config = {}
+            for config_key, value in env_items:
+                merge(env_config, config_key, value)
+            cached = (env_items, env_config)
+            cls._cache[env_prefix] = cached
         
+        # Fusionner une copie des valeurs en cache dans la configuration
+        for key, value in cached[1].items():
+            if isinstance(value, dict) and isinstance(config.get(key), dict):
+                config[key].update(cls._deep_copy(value))
+            else:
+                config[key] = cls._deep_copy(value)
+        
+        if with_flat:
+            return config, cls._flatten_config(config)
         return config
     
+    @staticmethod
+    def _flatten_config(config: Dict) -> Dict[str, Any]:
+        """
+        Construire une vue à plat d'une configuration imbriquée.
+        
+        Les valeurs sont partagées avec la configuration d'origine.
+        
+        Args:
+            config: Configuration imbriquée
+        
+        Returns:
+            Dictionnaire ``{"section.cle": valeur}`` (``{"cle": valeur}``
+            pour les clés de premier niveau qui ne sont pas des sections)
+        """
+        flat = {}
+        for section_name, section_config in config.items():
+            if isinstance(section_config, dict):
+                for key, value in section_config.items():
+                    flat[f"{section_name}.{key}"] = value
+            else:
+                flat[section_name] = section_config
+        return flat
+    
+    @staticmethod
+    def _iter_env_vars(prefix: str) -> Iterator[Tuple[str, str]]:
+        """
+        Parcourir les variables d'environnement portant le préfixe donné.
+        
+        Args:
+            prefix: Préfixe des variables d'environnement
+        
+        Yields:
+            Tuples (clé de configuration sans le préfixe, en minuscules, valeur)
+        """
+        prefix_len = len(prefix)
+        
+        # Sous POSIX, filtrer les clés en octets évite de décoder celles
+        # qui ne portent pas le préfixe
+        environb = getattr(os, 'environb', None)
+        if environb is not None:
+            bprefix = os.fsencode(prefix)
+            fsdecode = os.fsdecode
+            for bkey, bvalue in environb.items():
+                if bkey.startswith(bprefix):
+                    yield fsdecode(bkey)[prefix_len:].lower(), fsdecode(bvalue)
+            return
+        
+        environ = os.environ
+        for full_key in environ:
+            if full_key.startswith(prefix):
+                yield full_key[prefix_len:].lower(), environ[full_key]
+    
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Vider le cache des valeurs issues des variables d'environnement.
+        """
+        global _env_config_cache
+        
+        cls._cache.clear()
+        _env_config_cache = None
+    
     @classmethod
     def _merge_config_value(cls, config: Dict, key: str, value: str) -> Dict:
         """
         Fusionner une valeur dans la configuration existante.
         
+        La configuration est modifiée en place : l'appelant est responsable
+        d'en fournir une copie s'il ne souhaite pas altérer l'original.
+        
         Args:
-            config: Configuration existante
+            config: Configuration existante (modifiée en place)
             key: Clé de configuration (potentiellement imbriquée)
             value: Valeur à fusionner
         
         Returns:
-            Configuration mise à jour
+            Configuration mise à jour (le même objet que ``config``)
         """
-        # Copier la configuration pour éviter de modifier l'original
-        config = cls._deep_copy(config)
+        section, subsection = cls._split_config_key(key.lower())
+        converted_value = cls._convert_config_value(section, subsection, value)
         
-        # Séparer la clé par les underscores pour extraire les parties
-        parts = key.split('_')
-        
-        # Gérer correctement la section et la sous-section
-        if len(parts) >= 2:
-            section = parts[0].lower()
-            subsection = '_'.join(parts[1:]).lower()
-            
-            # Créer la section si elle n'existe pas
-            if section not in config:
-                config[section] = {}
-            
-            # Convertir la valeur au bon type
-            converted_value = cls._convert_value(value)
-            
-            # Cas spécial pour NEW_SECTION
-            if section.lower() == "new" and subsection.lower() == "section_new_option":
-                if "new_section" not in config:
-                    config["new_section"] = {}
-                config["new_section"]["new_option"] = converted_value
-            # Gérer le cas test_float_value
-            elif section.lower() == "test" and subsection.lower() == "float_value":
-                if "test" not in config:
-                    config["test"] = {}
-                config["test"]["float_value"] = float(value)
-            # Cas général
-            else:
-                config[section][subsection] = converted_value
-        else:
+        if section is None:
             # Cas de clé simple (rare)
-            config[key.lower()] = cls._convert_value(value)
+            config[subsection] = converted_value
+        else:
+            config.setdefault(section, {})[subsection] = converted_value
         
         return config
     
+    @classmethod
+    def _split_config_key(cls, key: str) -> Tuple[Optional[str], str]:
+        """
+        Séparer une clé de configuration en section et sous-clé.
+        
+        Args:
+            key: Clé de configuration (sans le préfixe, déjà en minuscules)
+        
+        Returns:
+            Tuple (section, sous-clé) ; la section vaut None pour une clé simple
+        """
+        section, separator, subsection = key.partition('_')
+        
+        # Les noms de section et de clé reviennent à chaque chargement :
+        # internés, leurs recherches dans les dictionnaires se font par identité
+        if not separator:
+            return None, intern(section)
+        section = intern(section)
+        subsection = intern(subsection)
+        
+        # Cas spécial pour NEW_SECTION
+        if section == "new" and subsection == "section_new_option":
+            return "new_section", "new_option"
+        
+        return section, subsection
+    
+    @classmethod
+    def _convert_config_value(cls, section: Optional[str], subsection: str, value: str) -> Any:
+        """
+        Convertir la valeur d'une clé de configuration au bon type.
+        
+        Args:
+            section: Section de la clé (None pour une clé simple)
+            subsection: Sous-clé
+            value: Valeur de la variable d'environnement
+        
+        Returns:
+            Valeur convertie
+        """
+        # Gérer le cas test_float_value
+        if section == "test" and subsection == "float_value":
+            return float(value)
+        return cls._convert_value(value)
+    
     @classmethod
     def _convert_value(cls, value: str) -> Any:
         """
@@ -128,27 +355,41 @@ class EnvConfigManager:
         Returns:
             Valeur convertie
         """
-        # Vérifier si c'est un JSON
-        if (value.startswith('{') and value.endswith('}')) or \
-           (value.startswith('[') and value.endswith(']')):
+        first = value[:1]
+        
+        # Vérifier si c'est un JSON (objet ou tableau) : un seul caractère
+        # suffit à écarter les autres valeurs, le parseur rejette le reste
+        if first in _JSON_STARTS:
             try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
+                return _json_loads(value)
+            except ValueError:
                 pass
         
+        # Entier décimal simple : int() direct, sans passer par lower()
+        # ni par les autres conversions ("1" et "0" restent des booléens)
+        if value.isdigit() and value.isascii():
+            if value == '1':
+                return True
+            if value == '0':
+                return False
+            return int(value)
+        
         # Conversion booléenne
-        if value.lower() in ['true', '1', 'yes', 'on']:
+        value_lower = value.lower()
+        if value_lower in _BOOL_TRUE:
             return True
-        if value.lower() in ['false', '0', 'no', 'off']:
+        if value_lower in _BOOL_FALSE:
             return False
         
-        # Conversion numérique
-        try:
-            if '.' in value:
-                return float(value)
-            return int(value)
-        except ValueError:
-            pass
+        # Conversion numérique, uniquement pour ce qui peut être un nombre
+        # (évite de lever une exception pour chaque chaîne simple)
+        if first in _NUMBER_STARTS:
+            try:
+                if '.' in value:
+                    return float(value)
+                return int(value)
+            except ValueError:
+                pass
         
         # Retourner en chaîne si aucune conversion
         return value
@@ -171,67 +412,40 @@ class EnvConfigManager:
         """
         # Default schema if not provided
         if config_schema is None:
-            config_schema = {
-                'general': {
-                    'main_branch': {
-                        'type': 'string',
-                        'description': 'Default main branch name',
-                        'example': 'main'
-                    },
-                    'verbose': {
-                        'type': 'boolean',
-                        'description': 'Enable verbose logging',
-                        'example': 'false'
-                    }
-                },
-                'sync': {
-                    'default_strategy': {
-                        'type': 'string',
-                        'description': 'Default sync strategy',
-                        'example': 'rebase'
-                    },
-                    'auto_sync': {
-                        'type': 'boolean',
-                        'description': 'Enable automatic synchronization',
-                        'example': 'true'
-                    }
-                }
-            }
+            config_schema = cls._DEFAULT_TEMPLATE_SCHEMA
         
-        # Generate environment variable template
-        env_template = ["# GitMove Configuration Environment Variables", ""]
+        env_prefix = cls.ENV_PREFIX
+        lines = ["# GitMove Configuration Environment Variables", ""]
         
-        def _process_config_section(section_name: str, section_config: Dict):
-            """Process a configuration section."""
+        # Process each section in the schema
+        for section_name, section_config in config_schema.items():
+            lines.append(f"# {section_name.capitalize()} Configuration")
+            
+            # Upper-case the section once for all of its keys
+            section_prefix = f"{env_prefix}{section_name.upper()}_"
+            
             for key, details in section_config.items():
-                # Construct full environment variable name
-                env_var = f"{cls.ENV_PREFIX}{section_name.upper()}_{key.upper()}"
-                
-                # Add description if requested
-                if include_descriptions and isinstance(details, dict):
-                    if details.get('description'):
-                        env_template.append(f"# {details['description']}")
+                # Add description and example if requested
+                if include_descriptions and isinstance(details, Mapping):
+                    description = details.get('description')
+                    if description:
+                        lines.append(f"# {description}")
                     
-                    # Add example if available
-                    if details.get('example'):
-                        env_template.append(f"# Example: {details['example']}")
+                    example = details.get('example')
+                    if example:
+                        lines.append(f"# Example: {example}")
                 
-                # Add environment variable placeholder
-                env_template.append(f"{env_var}=")
-                env_template.append("")
+                # Add environment variable placeholder followed by a blank line
+                lines.append(f"{section_prefix}{key.upper()}=\n")
         
-        # Process each section in the schema
-        for section_name, section_config in config_schema.items():
-            env_template.append(f"# {section_name.capitalize()} Configuration")
-            _process_config_section(section_name, section_config)
-        
-        return "\n".join(env_template)
+        return "\n".join(lines)
     
     @classmethod
     def validate_env_config(
         cls, 
         config: Dict, 
-        schema: Optional[Dict] = None
+        schema: Optional[Dict] = None,
+        flat_config: Optional[Dict[str, Any]] = None
     ) -> Dict[str, List[str]]:
         """
         Validate environment-loaded configuration against a schema.
@@ -239,66 +453,273 @@ class EnvConfigManager:
         Args:
             config: Configuration dictionary to validate
             schema: Validation schema
+            flat_config: Flat ``{"section.key": value}`` view of ``config``
+                (as returned by ``load_config(with_flat=True)``); when given,
+                it is validated directly instead of walking ``config``
         
         Returns:
             Dictionary of validation errors
         """
-        # Default validation schema
-        if schema is None:
-            schema = {
-                'general': {
-                    'main_branch': {
-                        'type': str,
-                        'pattern': r'^[a-zA-Z0-9_\-./]+$',
-                        'default': 'main'
-                    },
-                    'verbose': {
-                        'type': bool,
-                        'default': False
-                    }
-                },
-                'sync': {
-                    'default_strategy': {
-                        'type': str,
-                        'allowed': ['merge', 'rebase', 'auto'],
-                        'default': 'rebase'
-                    },
-                    'auto_sync': {
-                        'type': bool,
-                        'default': True
-                    }
-                }
-            }
+        # Schéma par défaut : validateur spécialisé généré à l'import
+        if schema is None and flat_config is None:
+            return cls._default_validator(config)
         
         errors = {}
+        for section_name, message in cls._iter_errors(config, schema, flat_config):
+            errors.setdefault(section_name, []).append(message)
+        return errors
+    
+    @classmethod
+    def has_errors(
+        cls, 
+        config: Dict, 
+        schema: Optional[Dict] = None,
+        flat_config: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Check whether a configuration has any validation error.
         
-        # Assurer que toutes les sections du schéma sont présentes
-        for section_name in schema:
-            if section_name not in config:
-                config[section_name] = {}
+        Stops at the first error found, without building the error report.
         
-        # Valider chaque section
-        for section_name, section_schema in schema.items():
-            section_errors = []
-            
-            for key, rules in section_schema.items():
-                value = config.get(section_name, {}).get(key)
-                
-                # Vérifier le type
-                if value is not None and "type" in rules:
-                    expected_type = rules["type"]
-                    if not isinstance(value, expected_type):
-                        section_errors.append(f"Type invalide pour {section_name}.{key}")
+        Args:
+            config: Configuration dictionary to validate
+            schema: Validation schema
+            flat_config: Flat ``{"section.key": value}`` view of ``config``
+        
+        Returns:
+            True if the configuration is invalid
+        """
+        return next(cls._iter_errors(config, schema, flat_config), None) is not None
+    
+    @classmethod
+    def _iter_errors(
+        cls, 
+        config: Dict, 
+        schema: Optional[Dict] = None,
+        flat_config: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate over the validation errors of a configuration.
+        
+        Args:
+            config: Configuration dictionary to validate
+            schema: Validation schema
+            flat_config: Flat ``{"section.key": value}`` view of ``config``;
+                when given, it is validated instead of walking ``config``
+        
+        Yields:
+            Tuples (section name, error message)
+        """
+        # Schéma compilé (expressions régulières et ensembles de valeurs)
+        if schema is None:
+            compiled_schema = cls._DEFAULT_COMPILED_SCHEMA
+            flat_schema = cls._DEFAULT_FLAT_SCHEMA
+        else:
+            compiled_schema, flat_schema = cls._compile_schema(schema)
+        
+        check_value = cls._iter_value_errors
+        
+        # Vue à plat : une seule recherche par valeur configurée
+        if flat_config is not None:
+            for dotted_key, value in flat_config.items():
+                if value is None:
+                    continue
+                rules = flat_schema.get(dotted_key)
+                if rules is None:
+                    continue
                 
-                # Vérifier les valeurs autorisées
-                if value is not None and "allowed" in rules and value not in rules["allowed"]:
-                    section_errors.append(f"Valeur invalide pour {section_name}.{key}. Valeurs autorisées: {rules['allowed']}")
+                section_name, _, key = dotted_key.partition('.')
+                for message in check_value(section_name, key, value, rules):
+                    yield section_name, message
+            return
+        
+        # Valider chaque section configurée (sans modifier la configuration)
+        for section_name, section_schema in compiled_schema.items():
+            section_config = config.get(section_name)
+            if section_config is None:
+                continue
             
-            if section_errors:
-                errors[section_name] = section_errors
+            for key, rules in section_schema.items():
+                value = section_config.get(key)
+                if value is None:
+                    continue
+                for message in check_value(section_name, key, value, rules):
+                    yield section_name, message
+    
+    @staticmethod
+    def _iter_value_errors(section_name: str, key: str, value: Any, rules: _CompiledRule) -> Iterator[str]:
+        """
+        Check a configured value against its compiled rules.
         
-        return errors
+        Args:
+            section_name: Section of the value
+            key: Key of the value
+            value: Value to check (not None)
+            rules: Compiled rules of the key
+        
+        Yields:
+            Validation error messages
+        """
+        rtype = rules.type
+        
+        # Vérifier le type ; les autres règles ne s'appliquent pas à une
+        # valeur du mauvais type
+        if rtype is not None and not isinstance(value, rtype):
+            yield (
+                f"Invalid type for {section_name}.{key}. "
+                f"Expected {EnvConfigManager._type_name(rtype)}, got {type(value).__name__}"
+            )
+            return
+        
+        pattern_re = rules.pattern_re
+        allowed_set = rules.allowed
+        
+        # Vérifier le format
+        if pattern_re is not None and isinstance(value, str) and not pattern_re.match(value):
+            yield f"Invalid format for {section_name}.{key}"
+        
+        # Vérifier les valeurs autorisées
+        if allowed_set is not None:
+            try:
+                is_allowed = value in allowed_set
+            except TypeError:
+                # Valeur non hachable (liste, dictionnaire...)
+                is_allowed = False
+            if not is_allowed:
+                yield f"Invalid value for {section_name}.{key}. Allowed values: {rules.allowed_values}"
+    
+    @staticmethod
+    def _type_name(rtype: Any) -> str:
+        """
+        Name an expected type for validation messages.
+        
+        Args:
+            rtype: Type, or tuple of types, expected by a rule
+        
+        Returns:
+            Name of the type (or of each type of the tuple)
+        """
+        if isinstance(rtype, type):
+            return rtype.__name__
+        if isinstance(rtype, tuple):
+            return " or ".join(EnvConfigManager._type_name(t) for t in rtype)
+        return str(rtype)
+    
+    @classmethod
+    def _compile_schema(cls, schema: Dict) -> Tuple[Dict, Dict]:
+        """
+        Compile a validation schema once for repeated use.
+        
+        Each rule becomes a ``_CompiledRule``: patterns are compiled to regular
+        expressions and allowed values are turned into frozensets. Compiled
+        schemas are cached by schema identity.
+        
+        Args:
+            schema: Validation schema
+        
+        Returns:
+            Tuple (compiled schema, flat ``{"section.key": rules}`` view)
+        """
+        cached = cls._schema_cache.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1], cached[2]
+        
+        compiled = {}
+        flat = {}
+        for section_name, section_schema in schema.items():
+            section_name = intern(section_name)
+            compiled_section = {}
+            for key, rules in section_schema.items():
+                key = intern(key)
+                compiled_rules = _CompiledRule(rules)
+                compiled_section[key] = compiled_rules
+                flat[f"{section_name}.{key}"] = compiled_rules
+            compiled[section_name] = compiled_section
+        
+        # Garder une référence au schéma pour que son identifiant reste valide
+        if len(cls._schema_cache) >= cls._SCHEMA_CACHE_SIZE:
+            cls._schema_cache.clear()
+        cls._schema_cache[id(schema)] = (schema, compiled, flat)
+        
+        return compiled, flat
 
+    @staticmethod
+    def _compile_validator(compiled_schema: Dict) -> typing.Callable[[Dict], Dict[str, List[str]]]:
+        """
+        Generate a validation function specialised for a compiled schema.
+        
+        Every rule is inlined in the generated source, so validating does not
+        look up the rules of each key. The function returns the same errors, in
+        the same order, as the generic validation.
+        
+        Args:
+            compiled_schema: Schema compiled by ``_compile_schema``
+        
+        Returns:
+            Function taking a configuration and returning its validation errors
+        """
+        namespace = {}
+        index = 0
+        lines = [
+            "def _validate(config):",
+            "    errors = {}",
+        ]
+        for section_name, section_schema in compiled_schema.items():
+            lines += [
+                f"    section = config.get({section_name!r})",
+                "    if section is not None:",
+                "        section_errors = []",
+            ]
+            for key, rules in section_schema.items():
+                index += 1
+                dotted_key = f"{section_name}.{key}"
+                lines += [
+                    f"        value = section.get({key!r})",
+                    "        if value is not None:",
+                ]
+                indent = " " * 12
+                rtype = rules.type
+                if rtype is not None:
+                    namespace[f"_type{index}"] = rtype
+                    message = (
+                        f"Invalid type for {dotted_key}. "
+                        f"Expected {EnvConfigManager._type_name(rtype)}, got "
+                    )
+                    lines += [
+                        f"{indent}if not isinstance(value, _type{index}):",
+                        f"{indent}    section_errors.append({message!r} + type(value).__name__)",
+                        f"{indent}else:",
+                    ]
+                    # Les autres règles ne s'appliquent qu'à une valeur du bon type
+                    indent += "    "
+                if rules.pattern_re is not None:
+                    namespace[f"_match{index}"] = rules.pattern_re.match
+                    lines += [
+                        f"{indent}if isinstance(value, str) and not _match{index}(value):",
+                        f"{indent}    section_errors.append({'Invalid format for ' + dotted_key!r})",
+                    ]
+                if rules.allowed is not None:
+                    namespace[f"_allowed{index}"] = rules.allowed
+                    message = f"Invalid value for {dotted_key}. Allowed values: {rules.allowed_values}"
+                    lines += [
+                        f"{indent}try:",
+                        f"{indent}    is_allowed = value in _allowed{index}",
+                        f"{indent}except TypeError:",
+                        f"{indent}    is_allowed = False",
+                        f"{indent}if not is_allowed:",
+                        f"{indent}    section_errors.append({message!r})",
+                    ]
+                # Garder le bloc valide même sans règle
+                lines.append(f"{indent}pass")
+            lines += [
+                "        if section_errors:",
+                f"            errors[{section_name!r}] = section_errors",
+            ]
+        lines.append("    return errors")
+        
+        exec("\n".join(lines), namespace)
+        return namespace["_validate"]
+    
     @classmethod
     def _deep_copy(cls, obj: Any) -> Any:
         """
@@ -317,8 +738,48 @@ class EnvConfigManager:
         else:
             return obj
 
+# Le schéma de validation par défaut n'est compilé qu'une fois
+(
+    EnvConfigManager._DEFAULT_COMPILED_SCHEMA,
+    EnvConfigManager._DEFAULT_FLAT_SCHEMA
+) = EnvConfigManager._compile_schema(EnvConfigManager._DEFAULT_VALIDATION_SCHEMA)
+EnvConfigManager._default_validator = staticmethod(
+    EnvConfigManager._compile_validator(EnvConfigManager._DEFAULT_COMPILED_SCHEMA)
+)
+
+# Validateur partagé entre load_env_config et gitmove.config.Config
+_config_validator = None
+
+# Dernière configuration normalisée sans configuration de base :
+# (variables d'environnement correspondantes, configuration, avertissements)
+_env_config_cache: Optional[Tuple[Tuple[Tuple[str, str], ...], Dict, List[str]]] = None
+
+
+def _get_validator():
+    """
+    Obtenir le validateur de configuration partagé, créé au premier appel.
+    
+    Returns:
+        Instance de ConfigValidator
+    """
+    global _config_validator
+    
+    if _config_validator is None:
+        # Import ici pour éviter les importations circulaires
+        from gitmove.validators.config_validator import ConfigValidator
+        _config_validator = ConfigValidator()
+    return _config_validator
+
+
+def _reset_validator() -> None:
+    """
+    Oublier le validateur partagé (utilisé par les tests).
+    """
+    global _config_validator
+    _config_validator = None
+
+
 # Optional configuration loader
-@staticmethod
 def load_env_config(base_config: Optional[Dict] = None) -> Dict:
     """
     Charge la configuration depuis les variables d'environnement.
@@ -329,20 +790,39 @@ def load_env_config(base_config: Optional[Dict] = None) -> Dict:
     Returns:
         Configuration enrichie
     """
-    # Import ici pour éviter les importations circulaires
-    from gitmove.validators.config_validator import ConfigValidator
+    global _env_config_cache
     
-    # Obtenir un validateur pour accéder au schéma
-    validator = ConfigValidator()
+    # Sans configuration de base, le résultat ne dépend que des variables
+    # GITMOVE_* : le réutiliser tant qu'elles n'ont pas changé. Une valeur
+    # contenant « $ » peut référencer d'autres variables (interpolées par le
+    # validateur), le résultat n'est alors pas mis en cache
+    env_items = None
+    if base_config is None:
+        env_items = tuple(sorted(EnvConfigManager._iter_env_vars(EnvConfigManager.ENV_PREFIX)))
+        if any('$' in value for _, value in env_items):
+            env_items = None
+        else:
+            cached = _env_config_cache
+            if cached is not None and cached[0] == env_items:
+                # Réafficher les avertissements de la validation mise en cache
+                if cached[2]:
+                    _get_validator()._display_validation_results([], cached[2])
+                return EnvConfigManager._deep_copy(cached[1])
+    
+    # Obtenir un validateur pour accéder au schéma (créé une seule fois)
+    validator = _get_validator()
     
     # Charger depuis les variables d'environnement
     env_config = EnvConfigManager.load_config(base_config=base_config)
     
     # Valider et normaliser la configuration
     try:
-        normalized_config = validator.validate_config(env_config)
-        return normalized_config
+        normalized_config, warnings = validator.validate_config(env_config, with_warnings=True)
     except ValueError:
         # En cas d'erreur de validation, on retourne la configuration de base
         # ou une configuration vide si aucune n'a été fournie
         return base_config or {}
+    
+    if env_items is not None:
+        _env_config_cache = (env_items, EnvConfigManager._deep_copy(normalized_config), warnings)
+    return normalized_config
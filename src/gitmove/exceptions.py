@@ -5,6 +5,8 @@ Ce module définit une hiérarchie d'exceptions spécifiques à GitMove
 pour permettre une meilleure gestion et récupération des erreurs.
 """
 
+import re
+
 class GitMoveError(Exception):
     """Exception de base pour toutes les erreurs de GitMove."""
     
@@ -103,6 +105,26 @@ class PluginExecutionError(PluginError):
     pass
 
 # Utilitaires pour la gestion des exceptions
+# Motifs reconnus dans les messages de GitCommandError (seul "conflict"
+# est insensible à la casse)
+_GIT_ERROR_RE = re.compile(
+    r"(?P<conflict>(?i:conflict))"
+    r"|(?P<missing>not a valid object name|did not match any file\(s\) known to git)"
+    r"|(?P<clean>working tree clean)"
+    r"|(?P<dirty>changes not staged)"
+    r"|(?P<sync>refusing to (?:pull|merge))"
+)
+
+# Exception associée à chaque motif, et ordre de priorité des motifs
+# (un conflit l'emporte toujours et est traité dès qu'il est trouvé)
+_GIT_ERROR_CLASSES = {
+    "conflict": MergeConflictError,
+    "missing": MissingBranchError,
+    "dirty": DirtyWorkingTreeError,
+    "sync": SyncError,
+}
+_GIT_ERROR_PRIORITY = ("missing", "dirty", "sync")
+
 def convert_git_error(git_error, message=None):
     """
     Convertit une erreur Git en exception GitMove appropriée.
@@ -122,17 +144,22 @@ def convert_git_error(git_error, message=None):
         return InvalidRepositoryError(error_msg, git_error)
     
     if isinstance(git_error, GitCommandError):
-        # Analyser le message d'erreur pour déterminer le type d'erreur
-        error_text = str(git_error)
+        # Analyser le message d'erreur en une seule passe : relever tous les
+        # motifs présents, puis appliquer l'ordre de priorité habituel
+        found = set()
+        for match in _GIT_ERROR_RE.finditer(str(git_error)):
+            kind = match.lastgroup
+            if kind == "conflict":
+                return _GIT_ERROR_CLASSES[kind](error_msg, git_error)
+            found.add(kind)
+        
+        # Un arbre de travail propre n'est jamais signalé comme modifié
+        if "clean" in found:
+            found.discard("dirty")
         
-        if "conflict" in error_text.lower():
-            return MergeConflictError(error_msg, git_error)
-        elif "not a valid object name" in error_text or "did not match any file(s) known to git" in error_text:
-            return MissingBranchError(error_msg, git_error)
-        elif "working tree clean" not in error_text and "changes not staged" in error_text:
-            return DirtyWorkingTreeError(error_msg, git_error)
-        elif "refusing to pull" in error_text or "refusing to merge" in error_text:
-            return SyncError(error_msg, git_error)
+        for kind in _GIT_ERROR_PRIORITY:
+            if kind in found:
+                return _GIT_ERROR_CLASSES[kind](error_msg, git_error)
         
     if message:
         return GitError(f"{error_msg} (Causé par: {git_error})")
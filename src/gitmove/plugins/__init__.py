@@ -1,6 +1,6 @@
 """
 GitMove Plugin Management System
 """
-from gitmove.plugins.manager import PluginManager, hook
+from gitmove.plugins.manager import HookType, PluginManager, hook
 
-__all__ = ['PluginManager', 'hook']
\ No newline at end of file
+__all__ = ['HookType', 'PluginManager', 'hook']
\ No newline at end of file
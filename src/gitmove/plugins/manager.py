@@ -5,27 +5,113 @@ Allows extending GitMove functionality through a flexible plugin architecture.
 """
 
 import os
+import re
+import sys
 import importlib
-import inspect
-from typing import Dict, Any, Callable, List
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from functools import lru_cache, wraps
+from types import FunctionType
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+
+from gitmove.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Entry point group under which installed packages declare GitMove plugins
+ENTRY_POINT_GROUP = "gitmove.plugins"
+
+# Shared result of hook types without any registered hook
+_EMPTY = ()
+
+# Minimum number of plugin files for which imports run in a thread pool,
+# and maximum number of import threads
+_PARALLEL_IMPORT_MIN = 3
+_PARALLEL_IMPORT_WORKERS = 8
+
+# Plugin module file: "<name>.py" not starting with "__" (group 1 is the name)
+_PLUGIN_FILE_MATCH = re.compile(r'(?!__)(.+)\.py', re.DOTALL).fullmatch
+
+class HookType(IntEnum):
+    """
+    Hook types supported by GitMove (index into the per-type hook lists).
+    """
+    PRE_BRANCH_CLEAN = 0
+    POST_BRANCH_CLEAN = 1
+    PRE_SYNC = 2
+    POST_SYNC = 3
+    CONFLICT_RESOLUTION = 4
+    BRANCH_STRATEGY = 5
+
+# Hook type names indexed by HookType, interned: the generated lower-case
+# names would otherwise be fresh strings, unlike the literals callers pass
+_HOOK_NAMES = tuple(sys.intern(hook_type.name.lower()) for hook_type in HookType)
+
+@lru_cache(maxsize=None)
+def _hook_index(hook_type: Union[str, int]) -> Optional[HookType]:
+    """
+    Convert a hook type name (e.g. 'pre_sync') to its HookType.
+    
+    Args:
+        hook_type: Hook type name or HookType value
+    
+    Returns:
+        Matching HookType, or None for an unknown hook type
+    """
+    try:
+        if isinstance(hook_type, str):
+            return HookType[hook_type.upper()]
+        return HookType(hook_type)
+    except (KeyError, ValueError):
+        return None
+
+def _safe(func: Callable) -> Callable:
+    """
+    Wrap a hook so that its exceptions are reported instead of raised.
+    
+    Args:
+        func: Hook function
+    
+    Returns:
+        Wrapper returning the hook result, or None if the hook raised
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            logger.exception("Error in %s hook: %s", func.__name__, e)
+            return None
+    return wrapper
 
 class PluginManager:
-    def __init__(self, plugin_dir: str = None):
+    __slots__ = (
+        'plugins', 'hooks', 'plugin_dir',
+        '_pending_hooks', '_hook_lists',
+        '_loaded_modules', '_dir_mtime', '_entry_points', '_registered_modules',
+        '_load_thread',
+    )
+    
+    def __init__(self, plugin_dir: str = None, load_in_background: bool = False):
         """
         Initialize plugin management system.
         
         Args:
             plugin_dir: Directory containing plugin modules
+            load_in_background: Start loading plugins in a background thread
+                (hook execution waits for it to finish)
         """
         self.plugins: Dict[str, Any] = {}
-        self.hooks: Dict[str, List[Callable]] = {
-            'pre_branch_clean': [],
-            'post_branch_clean': [],
-            'pre_sync': [],
-            'post_sync': [],
-            'conflict_resolution': [],
-            'branch_strategy': []
-        }
+        
+        # Hooks being registered, one list per HookType (indexed by its
+        # value); freeze() publishes them as the tuples that execute_hook()
+        # iterates, also exposed by (interned) hook type name in ``hooks``
+        self._pending_hooks: Tuple[List[Callable], ...] = tuple([] for _ in HookType)
+        self._hook_lists: List[Tuple[Callable, ...]] = [_EMPTY for _ in HookType]
+        self.hooks: Dict[str, Tuple[Callable, ...]] = {}
+        self.freeze()
         
         # Default plugin directory
         if plugin_dir is None:
@@ -37,64 +123,311 @@ class PluginManager:
         
         self.plugin_dir = plugin_dir
         os.makedirs(plugin_dir, exist_ok=True)
+        
+        # Plugin modules already registered, and plugin directory mtime at
+        # the last scan (a later load_plugins() is a no-op until it changes)
+        self._loaded_modules = set()
+        self._dir_mtime = None
+        
+        # Installed plugin entry points, discovered once
+        self._entry_points = None
+        
+        # Registered plugin modules: name -> (source file mtime, hooks
+        # registered as (name, hook type, wrapped function) triples)
+        self._registered_modules: Dict[str, Tuple[int, Tuple[Tuple[str, HookType, Callable], ...]]] = {}
+        
+        # Background plugin loading in progress, if any
+        self._load_thread: Optional[threading.Thread] = None
+        if load_in_background:
+            self.load_plugins_in_background()
+    
+    def _discover_entry_points(self):
+        """
+        Discover the plugins declared by installed packages.
+        
+        Installed distributions are scanned once; the entry points found
+        are kept for later calls.
+        
+        Returns:
+            Tuple of entry points of the ``gitmove.plugins`` group
+        """
+        if self._entry_points is None:
+            try:
+                from importlib.metadata import entry_points
+            except ImportError:
+                self._entry_points = ()
+                return self._entry_points
+            
+            try:
+                discovered = entry_points(group=ENTRY_POINT_GROUP)
+            except TypeError:
+                # Python < 3.10: entry_points() returns a dict of groups
+                discovered = entry_points().get(ENTRY_POINT_GROUP, ())
+            self._entry_points = tuple(discovered)
+        
+        return self._entry_points
+    
+    def load_plugins_in_background(self):
+        """
+        Start loading plugins in a daemon thread, off the startup path.
+        
+        Hook execution, and any later load, waits for it to finish.
+        """
+        self.wait_for_plugins()
+        self._load_thread = threading.Thread(
+            target=self._load_plugins,
+            name="gitmove-plugins",
+            daemon=True
+        )
+        self._load_thread.start()
+    
+    def wait_for_plugins(self):
+        """
+        Wait for a background plugin load, if one is in progress.
+        """
+        load_thread = self._load_thread
+        if load_thread is not None:
+            load_thread.join()
+            self._load_thread = None
     
     def load_plugins(self):
         """
-        Discover and load plugins from plugin directory.
+        Discover and load plugins from installed entry points and from the
+        plugin directory, then freeze the registered hooks.
+        """
+        self.wait_for_plugins()
+        self._load_plugins()
+    
+    def _load_plugins(self):
+        """
+        Load plugins (see load_plugins()).
+        """
+        for entry_point in self._discover_entry_points():
+            if entry_point.name in self._loaded_modules:
+                continue
+            try:
+                module = entry_point.load()
+                self._register_plugin_hooks(module)
+                self._loaded_modules.add(entry_point.name)
+            except ImportError as e:
+                logger.exception("Error loading plugin %s: %s", entry_point.name, e)
+        
+        dir_mtime = os.stat(self.plugin_dir).st_mtime_ns
+        if dir_mtime == self._dir_mtime:
+            self.freeze()
+            return
+        
+        targets = []
+        with os.scandir(self.plugin_dir) as entries:
+            for entry in entries:
+                match = _PLUGIN_FILE_MATCH(entry.name)
+                if match is None:
+                    continue
+                
+                module_name = match.group(1)
+                if module_name in self._loaded_modules or not entry.is_file():
+                    continue
+                targets.append((module_name, entry.path))
+        
+        # Plugin imports are mostly file I/O: overlap them in a thread pool
+        # when there are enough of them, then register hooks sequentially
+        if len(targets) >= _PARALLEL_IMPORT_MIN:
+            workers = min(_PARALLEL_IMPORT_WORKERS, len(targets))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(self._try_load_plugin_file, targets))
+        else:
+            loaded = [self._try_load_plugin_file(target) for target in targets]
+        
+        failed = False
+        for (module_name, _), module in zip(targets, loaded):
+            if isinstance(module, ImportError):
+                logger.error("Error loading plugin %s: %s", module_name, module, exc_info=module)
+                failed = True
+                continue
+            self._register_plugin_hooks(module)
+            self._loaded_modules.add(module_name)
+        
+        # Plugins that failed to load are retried on the next call, even if
+        # the plugin directory is unchanged
+        if not failed:
+            self._dir_mtime = dir_mtime
+        self.freeze()
+    
+    def reload(self):
+        """
+        Reload plugins, picking up new and modified plugin files.
         """
-        for filename in os.listdir(self.plugin_dir):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                module_name = filename[:-3]
-                try:
-                    module = importlib.import_module(f"gitmove_plugins.{module_name}")
-                    self._register_plugin_hooks(module)
-                except ImportError as e:
-                    print(f"Error loading plugin {module_name}: {e}")
+        self.wait_for_plugins()
+        for module_name in self._loaded_modules:
+            sys.modules.pop(f"gitmove_plugins.{module_name}", None)
+        self._loaded_modules.clear()
+        self._dir_mtime = None
+        self._entry_points = None
+        self.load_plugins()
+    
+    def freeze(self):
+        """
+        Publish the registered hooks as the tuples used by execute_hook().
+        """
+        self._hook_lists[:] = [tuple(hooks) for hooks in self._pending_hooks]
+        self.hooks = dict(zip(_HOOK_NAMES, self._hook_lists))
+    
+    def add_hook(self, hook_type: Union[HookType, str], func: Callable):
+        """
+        Register a single hook function.
+        
+        Args:
+            hook_type: Type of hook (HookType or hook type name)
+            func: Hook function
+        
+        Raises:
+            ValueError: If the hook type is unknown
+        """
+        hook_index = _hook_index(hook_type)
+        if hook_index is None:
+            raise ValueError(f"Unknown hook type: {hook_type}")
+        
+        self.wait_for_plugins()
+        hooks = self._pending_hooks[hook_index]
+        hooks.append(_safe(func))
+        self._hook_lists[hook_index] = self.hooks[_HOOK_NAMES[hook_index]] = tuple(hooks)
+        self.plugins[func.__name__] = func
+    
+    @classmethod
+    def _try_load_plugin_file(cls, target: Tuple[str, str]):
+        """
+        Load a plugin file, returning the import error instead of raising it.
+        
+        Args:
+            target: (module name, file path) pair
+        
+        Returns:
+            Plugin module, or the ImportError raised while loading it
+        """
+        try:
+            return cls._load_plugin_file(*target)
+        except ImportError as e:
+            return e
+    
+    @staticmethod
+    def _load_plugin_file(module_name: str, path: str):
+        """
+        Load a plugin module straight from its file in the plugin directory.
+        
+        The file path is already known from the directory scan, so the
+        import system finders are bypassed.
+        
+        Args:
+            module_name: Plugin module name (file name without ``.py``)
+            path: Path of the plugin file
+        
+        Returns:
+            Plugin module, registered as ``gitmove_plugins.<module_name>``
+        """
+        name = f"gitmove_plugins.{module_name}"
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None:
+            raise ImportError(f"Cannot load plugin file {path}", name=name)
+        
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+        return module
     
     def _register_plugin_hooks(self, module):
         """
         Register hooks from a plugin module.
         
+        Registering a module again is a no-op while its source file is
+        unchanged; otherwise its previous hooks are replaced.
+        
         Args:
             module: Imported plugin module
         """
-        for name, func in inspect.getmembers(module, inspect.isfunction):
+        key = module.__name__
+        module_file = getattr(module, '__file__', None)
+        mtime = os.stat(module_file).st_mtime_ns if module_file else 0
+        
+        registered = self._registered_modules.get(key)
+        if registered is not None:
+            if registered[0] == mtime:
+                return
+            for name, hook_type, wrapper in registered[1]:
+                self._pending_hooks[hook_type].remove(wrapper)
+                if self.plugins.get(name) is wrapper.__wrapped__:
+                    del self.plugins[name]
+        
+        # Scan the module namespace directly, in definition order
+        module_hooks = []
+        for name, func in vars(module).items():
+            if type(func) is not FunctionType:
+                continue
+            
             # Check for hook decorators
-            if hasattr(func, '_gitmove_hook'):
-                hook_type = func._gitmove_hook
-                self.hooks[hook_type].append(func)
-                self.plugins[name] = func
+            hook_type = getattr(func, '_gitmove_hook', None)
+            if hook_type is not None:
+                hook_type = _hook_index(hook_type)
+                module_hooks.append((name, hook_type, _safe(func)))
+        
+        # Hooks are stored wrapped by _safe(), so that execute_hook() needs
+        # no exception handling of its own; they take effect on freeze()
+        for name, hook_type, wrapper in module_hooks:
+            self._pending_hooks[hook_type].append(wrapper)
+            self.plugins[name] = wrapper.__wrapped__
+        
+        self._registered_modules[key] = (mtime, tuple(module_hooks))
     
-    def execute_hook(self, hook_type: str, *args, **kwargs):
+    def execute_hook(self, hook_type: Union[HookType, str], *args, **kwargs):
         """
         Execute all registered hooks for a specific hook type.
         
         Args:
-            hook_type: Type of hook to execute
+            hook_type: Type of hook to execute (HookType or hook type name)
             *args: Positional arguments to pass to hooks
             **kwargs: Keyword arguments to pass to hooks
         
         Returns:
-            List of results from hook executions
+            List of results from hook executions, None for a hook that
+            raised (an empty tuple when no hook is registered for this type)
         """
-        results = []
-        for hook in self.hooks.get(hook_type, []):
-            try:
-                result = hook(*args, **kwargs)
-                results.append(result)
-            except Exception as e:
-                print(f"Error in {hook.__name__} hook: {e}")
-        return results
+        if self._load_thread is not None:
+            self.wait_for_plugins()
+        
+        if type(hook_type) is not HookType:
+            hook_type = _hook_index(hook_type)
+            if hook_type is None:
+                return _EMPTY
+        
+        hooks = self._hook_lists[hook_type]
+        if not hooks:
+            return _EMPTY
+        
+        return [hook(*args, **kwargs) for hook in hooks]
 
-def hook(hook_type: str):
+def hook(hook_type: Union[HookType, str]):
     """
     Decorator to mark functions as GitMove plugin hooks.
     
     Args:
         hook_type: Type of hook (e.g., 'pre_branch_clean', 'post_sync')
+    
+    Raises:
+        ValueError: If the hook type is unknown
     """
+    hook_index = _hook_index(hook_type)
+    if hook_index is None:
+        raise ValueError(f"Unknown hook type: {hook_type}")
+    
     def decorator(func):
-        func._gitmove_hook = hook_type
+        func._gitmove_hook = hook_index
         return func
     return decorator
 
@@ -116,9 +449,10 @@ def example_plugin():
             Filtered list of branches or raises exception
         """
         # Custom logic to prevent cleaning certain branches
+        # (one startswith call per branch, with a tuple of prefixes)
         return [
             branch for branch in branches 
-            if not branch.startswith('temp_') and not branch.startswith('wip/')
+            if not branch.startswith(('temp_', 'wip/'))
         ]
     
     # Sample conflict resolution hook
@@ -138,10 +472,16 @@ def example_plugin():
 
 # Integration with core GitMove components
 class GitMovePluginAwareComponent:
+    __slots__ = ('plugin_manager', '_execute_hook', '_hook_lists')
+    
     def __init__(self, plugin_manager: PluginManager):
         self.plugin_manager = plugin_manager
+        
+        # Bound once: the manager updates its hook lists in place
+        self._execute_hook = plugin_manager.execute_hook
+        self._hook_lists = plugin_manager._hook_lists
     
-    def _apply_plugin_hooks(self, hook_type: str, *args, **kwargs):
+    def _apply_plugin_hooks(self, hook_type: Union[HookType, str], *args, **kwargs):
         """
         Helper method to apply plugin hooks in core components.
         
@@ -153,12 +493,25 @@ class GitMovePluginAwareComponent:
         Returns:
             Modified arguments or results from hooks
         """
-        hook_results = self.plugin_manager.execute_hook(hook_type, *args, **kwargs)
+        # Nothing to do for hook types without registered hooks (the default)
+        if type(hook_type) is not HookType:
+            hook_type = _hook_index(hook_type)
+            if hook_type is None:
+                return None
+        if not self._hook_lists[hook_type]:
+            # Unless plugins are still loading in the background
+            if self.plugin_manager._load_thread is None:
+                return None
+            self.plugin_manager.wait_for_plugins()
+            if not self._hook_lists[hook_type]:
+                return None
+        
+        hook_results = self._execute_hook(hook_type, *args, **kwargs)
         
-        # Allow plugins to modify arguments or provide alternative implementations
-        if hook_results:
-            # Use the last non-None result
-            final_result = next((r for r in reversed(hook_results) if r is not None), None)
-            return final_result
+        # Allow plugins to modify arguments or provide alternative implementations:
+        # use the last non-None result
+        for result in reversed(hook_results):
+            if result is not None:
+                return result
         
         return None
\ No newline at end of file
@@ -5,18 +5,35 @@ Ce package fournit des composants avancés pour améliorer
 l'expérience utilisateur dans l'interface en ligne de commande.
 """
 
-from gitmove.ui.components import (
-    UIManager,
-    ProgressManager,
-    BranchVisualizer,
-    ErrorFormatter,
-    ResultFormatter
-)
-
 __all__ = [
     'UIManager',
     'ProgressManager',
     'BranchVisualizer',
     'ErrorFormatter',
     'ResultFormatter',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """
+    Importe les composants à la demande (PEP 562).
+    
+    Le module ``components`` (et Rich) n'est chargé qu'au premier accès
+    à l'un de ses symboles, pas à l'import de ``gitmove.ui``.
+    
+    Args:
+        name: Nom de l'attribut demandé
+        
+    Returns:
+        Composant correspondant
+    """
+    if name in __all__:
+        from gitmove.ui import components
+        value = getattr(components, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,137 +6,43 @@ et des suggestions intelligentes pour les commandes.
 """
 
 import os
-import sys
-from typing import List, Dict, Optional, Any, Callable, Set, Tuple
+import time
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
-def generate_bash_completion() -> str:
+# Les scripts d'auto-complétion sont livrés comme données du package
+# (gitmove/ui/completions) et ne sont lus que lorsqu'ils sont demandés
+_COMPLETIONS_DIR = "completions"
+
+@lru_cache(maxsize=None)
+def _load_completion(name: str) -> str:
     """
-    Génère un script d'auto-complétion pour Bash.
+    Charge un script d'auto-complétion livré avec le package.
     
+    Args:
+        name: Nom du fichier dans gitmove/ui/completions
+        
     Returns:
         Contenu du script d'auto-complétion
     """
-    return """
-# GitMove bash completion script
-
-_gitmove_completion() {
-    local cur prev opts
-    COMPREPLY=()
-    cur="${COMP_WORDS[COMP_CWORD]}"
-    prev="${COMP_WORDS[COMP_CWORD-1]}"
-    
-    # Liste des commandes principales
-    commands="clean sync advice check-conflicts init status config cicd env detect-ci"
-    
-    # Options globales
-    global_opts="--verbose -v --quiet -q --config -c --help -h --version"
-    
-    # Options spécifiques aux commandes
-    clean_opts="--remote --dry-run --force -f --exclude"
-    sync_opts="--strategy --branch"
-    advice_opts="--branch --target"
-    check_conflicts_opts="--branch --target"
-    init_opts="--config"
-    status_opts="--detailed"
-    config_opts="generate validate"
-    cicd_opts="generate-workflow validate-branch workflow-report"
-    env_opts="generate-template validate list"
+    try:
+        from importlib.resources import files
+    except ImportError:
+        # Python < 3.9
+        path = os.path.join(os.path.dirname(__file__), _COMPLETIONS_DIR, name)
+        with open(path, encoding='utf-8') as f:
+            return f.read()
     
-    # Complétion selon le contexte
-    case "${COMP_WORDS[1]}" in
-        clean)
-            case "$prev" in
-                --exclude)
-                    # Proposer les branches Git locales
-                    local branches=$(git branch --format='%(refname:short)')
-                    COMPREPLY=( $(compgen -W "${branches}" -- ${cur}) )
-                    return 0
-                    ;;
-                --strategy)
-                    COMPREPLY=( $(compgen -W "merge rebase auto" -- ${cur}) )
-                    return 0
-                    ;;
-                *)
-                    COMPREPLY=( $(compgen -W "${clean_opts}" -- ${cur}) )
-                    return 0
-                    ;;
-            esac
-            ;;
-        sync)
-            case "$prev" in
-                --strategy)
-                    COMPREPLY=( $(compgen -W "merge rebase auto" -- ${cur}) )
-                    return 0
-                    ;;
-                --branch)
-                    # Proposer les branches Git locales
-                    local branches=$(git branch --format='%(refname:short)')
-                    COMPREPLY=( $(compgen -W "${branches}" -- ${cur}) )
-                    return 0
-                    ;;
-                *)
-                    COMPREPLY=( $(compgen -W "${sync_opts}" -- ${cur}) )
-                    return 0
-                    ;;
-            esac
-            ;;
-        advice|check-conflicts)
-            case "$prev" in
-                --branch|--target)
-                    # Proposer les branches Git locales
-                    local branches=$(git branch --format='%(refname:short)')
-                    COMPREPLY=( $(compgen -W "${branches}" -- ${cur}) )
-                    return 0
-                    ;;
-                *)
-                    if [[ ${COMP_WORDS[1]} == "advice" ]]; then
-                        COMPREPLY=( $(compgen -W "${advice_opts}" -- ${cur}) )
-                    else
-                        COMPREPLY=( $(compgen -W "${check_conflicts_opts}" -- ${cur}) )
-                    fi
-                    return 0
-                    ;;
-            esac
-            ;;
-        config)
-            if [[ ${COMP_CWORD} -eq 2 ]]; then
-                COMPREPLY=( $(compgen -W "${config_opts}" -- ${cur}) )
-                return 0
-            fi
-            ;;
-        cicd)
-            if [[ ${COMP_CWORD} -eq 2 ]]; then
-                COMPREPLY=( $(compgen -W "${cicd_opts}" -- ${cur}) )
-                return 0
-            elif [[ ${COMP_CWORD} -eq 3 && ${COMP_WORDS[2]} == "generate-workflow" ]]; then
-                COMPREPLY=( $(compgen -W "--platform --output" -- ${cur}) )
-                return 0
-            elif [[ ${prev} == "--platform" ]]; then
-                COMPREPLY=( $(compgen -W "github_actions gitlab_ci jenkins travis_ci circleci" -- ${cur}) )
-                return 0
-            fi
-            ;;
-        env)
-            if [[ ${COMP_CWORD} -eq 2 ]]; then
-                COMPREPLY=( $(compgen -W "${env_opts}" -- ${cur}) )
-                return 0
-            fi
-            ;;
-        *)
-            # Complétion des commandes principales ou options globales
-            if [[ ${COMP_CWORD} -eq 1 ]]; then
-                COMPREPLY=( $(compgen -W "${commands}" -- ${cur}) )
-            else
-                COMPREPLY=( $(compgen -W "${global_opts}" -- ${cur}) )
-            fi
-            return 0
-            ;;
-    esac
-}
+    return files(__package__).joinpath(_COMPLETIONS_DIR).joinpath(name).read_text(encoding='utf-8')
 
-# Enregistrement de la fonction de complétion
-complete -F _gitmove_completion gitmove
-"""
+def generate_bash_completion() -> str:
+    """
+    Génère un script d'auto-complétion pour Bash.
+    
+    Returns:
+        Contenu du script d'auto-complétion
+    """
+    return _load_completion('gitmove.bash')
 
 def generate_zsh_completion() -> str:
     """
@@ -145,149 +51,7 @@ def generate_zsh_completion() -> str:
     Returns:
         Contenu du script d'auto-complétion
     """
-    return """
-#compdef gitmove
-
-_gitmove() {
-    local -a commands
-    local -a options
-    
-    commands=(
-        'clean:Nettoie les branches fusionnées'
-        'sync:Synchronise la branche courante avec la principale'
-        'advice:Suggère une stratégie pour fusionner/rebaser'
-        'check-conflicts:Détecte les conflits potentiels'
-        'init:Initialise la configuration de gitmove pour le dépôt'
-        'status:Affiche l\'état actuel des branches et recommandations'
-        'config:Commandes de gestion de configuration'
-        'cicd:Commandes de gestion CI/CD'
-        'env:Commandes de gestion des variables d\'environnement'
-        'detect-ci:Détecte l\'environnement CI courant'
-    )
-    
-    global_options=(
-        '--verbose[Affiche des informations détaillées]'
-        '-v[Affiche des informations détaillées]'
-        '--quiet[Minimise les sorties]'
-        '-q[Minimise les sorties]'
-        '--config[Spécifie un fichier de configuration alternatif]:fichier:_files'
-        '-c[Spécifie un fichier de configuration alternatif]:fichier:_files'
-        '--help[Affiche l\'aide]'
-        '-h[Affiche l\'aide]'
-        '--version[Affiche la version]'
-    )
-    
-    # Sous-commandes pour config
-    local -a config_commands
-    config_commands=(
-        'generate:Génère un exemple de fichier de configuration'
-        'validate:Valide le fichier de configuration'
-    )
-    
-    # Sous-commandes pour cicd
-    local -a cicd_commands
-    cicd_commands=(
-        'generate-workflow:Génère un workflow CI/CD'
-        'validate-branch:Valide un nom de branche'
-        'workflow-report:Génère un rapport sur les workflows'
-    )
-    
-    # Sous-commandes pour env
-    local -a env_commands
-    env_commands=(
-        'generate-template:Génère un modèle de variables d\'environnement'
-        'validate:Valide les variables d\'environnement'
-        'list:Liste les variables d\'environnement GitMove'
-    )
-    
-    _arguments -C \\
-        ${global_options[@]} \\
-        ': :->command' \\
-        '*:: :->option-or-argument'
-        
-    case $state in
-        command)
-            _describe -t commands "Commandes GitMove" commands
-            ;;
-        option-or-argument)
-            case $words[1] in
-                clean)
-                    _arguments \\
-                        '--remote[Nettoie également les branches distantes]' \\
-                        '--dry-run[Simule l\'opération sans effectuer de changements]' \\
-                        '--force[Ne pas demander de confirmation]' \\
-                        '-f[Ne pas demander de confirmation]' \\
-                        '*--exclude=[Branches à exclure du nettoyage]:branche:_git_branch_names'
-                    ;;
-                sync)
-                    _arguments \\
-                        '--strategy=[Stratégie de synchronisation à utiliser]:stratégie:(merge rebase auto)' \\
-                        '--branch=[Branche à synchroniser]:branche:_git_branch_names'
-                    ;;
-                advice|check-conflicts)
-                    _arguments \\
-                        '--branch=[Branche à analyser]:branche:_git_branch_names' \\
-                        '--target=[Branche cible]:branche:_git_branch_names'
-                    ;;
-                status)
-                    _arguments \\
-                        '--detailed[Affiche des informations détaillées]'
-                    ;;
-                init)
-                    _arguments \\
-                        '--config=[Chemin vers un fichier de configuration à utiliser comme base]:fichier:_files'
-                    ;;
-                config)
-                    _describe -t config_commands "Commandes de configuration" config_commands
-                    case $words[2] in
-                        generate)
-                            _arguments \\
-                                '--output=[Chemin de sortie pour l\'exemple de configuration]:fichier:_files'
-                            ;;
-                        validate)
-                            _arguments \\
-                                '--config=[Chemin du fichier de configuration]:fichier:_files'
-                            ;;
-                    esac
-                    ;;
-                cicd)
-                    _describe -t cicd_commands "Commandes CI/CD" cicd_commands
-                    case $words[2] in
-                        generate-workflow)
-                            _arguments \\
-                                '--platform=[Plateforme CI/CD cible]:plateforme:(github_actions gitlab_ci jenkins travis_ci circleci)' \\
-                                '--output=[Chemin de sortie pour le fichier de workflow]:fichier:_files'
-                            ;;
-                        validate-branch)
-                            _arguments \\
-                                ': :_git_branch_names'
-                            ;;
-                        workflow-report)
-                            _arguments \\
-                                '--output=[Chemin de sortie pour le rapport]:fichier:_files'
-                            ;;
-                    esac
-                    ;;
-                env)
-                    _describe -t env_commands "Commandes de gestion des variables d'environnement" env_commands
-                    case $words[2] in
-                        generate-template)
-                            _arguments \\
-                                '--output=[Chemin de sortie pour le modèle]:fichier:_files'
-                            ;;
-                        validate)
-                            _arguments \\
-                                '--prefix=[Préfixe des variables d\'environnement]:préfixe'
-                            ;;
-                    esac
-                    ;;
-            esac
-            ;;
-    esac
-}
-
-_gitmove
-"""
+    return _load_completion('_gitmove')
 
 def generate_fish_completion() -> str:
     """
@@ -296,125 +60,80 @@ def generate_fish_completion() -> str:
     Returns:
         Contenu du script d'auto-complétion
     """
-    return """
-# GitMove fish completion
-
-function __fish_gitmove_branches
-    git branch --format="%(refname:short)" 2>/dev/null
-end
-
-function __fish_gitmove_needs_command
-    set -l cmd (commandline -opc)
-    if [ (count $cmd) -eq 1 ]
-        return 0
-    end
-    return 1
-end
-
-function __fish_gitmove_using_command
-    set -l cmd (commandline -opc)
-    if [ (count $cmd) -gt 1 ]
-        if [ $argv[1] = $cmd[2] ]
-            return 0
-        end
-    end
-    return 1
-end
-
-function __fish_gitmove_using_subcommand
-    set -l cmd (commandline -opc)
-    if [ (count $cmd) -gt 2 ]
-        if [ $argv[1] = $cmd[2] -a $argv[2] = $cmd[3] ]
-            return 0
-        end
-    end
-    return 1
-end
-
-# Commandes principales
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "clean" -d "Nettoie les branches fusionnées"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "sync" -d "Synchronise la branche courante avec la principale"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "advice" -d "Suggère une stratégie pour fusionner/rebaser"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "check-conflicts" -d "Détecte les conflits potentiels"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "init" -d "Initialise la configuration de gitmove pour le dépôt"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "status" -d "Affiche l'état actuel des branches et recommandations"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "config" -d "Commandes de gestion de configuration"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "cicd" -d "Commandes de gestion CI/CD"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "env" -d "Commandes de gestion des variables d'environnement"
-complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "detect-ci" -d "Détecte l'environnement CI courant"
+    return _load_completion('gitmove.fish')
 
-# Options globales
-complete -f -c gitmove -s v -l verbose -d "Affiche des informations détaillées"
-complete -f -c gitmove -s q -l quiet -d "Minimise les sorties"
-complete -f -c gitmove -s c -l config -d "Spécifie un fichier de configuration alternatif" -r
-complete -f -c gitmove -s h -l help -d "Affiche l'aide"
-complete -f -c gitmove -l version -d "Affiche la version"
-
-# Options pour 'clean'
-complete -f -c gitmove -n "__fish_gitmove_using_command clean" -l remote -d "Nettoie également les branches distantes"
-complete -f -c gitmove -n "__fish_gitmove_using_command clean" -l dry-run -d "Simule l'opération sans effectuer de changements"
-complete -f -c gitmove -n "__fish_gitmove_using_command clean" -s f -l force -d "Ne pas demander de confirmation"
-complete -f -c gitmove -n "__fish_gitmove_using_command clean" -l exclude -d "Branches à exclure du nettoyage" -a "(__fish_gitmove_branches)"
-
-# Options pour 'sync'
-complete -f -c gitmove -n "__fish_gitmove_using_command sync" -l strategy -d "Stratégie de synchronisation à utiliser" -a "merge rebase auto"
-complete -f -c gitmove -n "__fish_gitmove_using_command sync" -l branch -d "Branche à synchroniser" -a "(__fish_gitmove_branches)"
-
-# Options pour 'advice' et 'check-conflicts'
-complete -f -c gitmove -n "__fish_gitmove_using_command advice" -l branch -d "Branche à analyser" -a "(__fish_gitmove_branches)"
-complete -f -c gitmove -n "__fish_gitmove_using_command advice" -l target -d "Branche cible" -a "(__fish_gitmove_branches)"
-complete -f -c gitmove -n "__fish_gitmove_using_command check-conflicts" -l branch -d "Branche à vérifier" -a "(__fish_gitmove_branches)"
-complete -f -c gitmove -n "__fish_gitmove_using_command check-conflicts" -l target -d "Branche cible" -a "(__fish_gitmove_branches)"
-
-# Options pour 'status'
-complete -f -c gitmove -n "__fish_gitmove_using_command status" -l detailed -d "Affiche des informations détaillées"
-
-# Options pour 'init'
-complete -f -c gitmove -n "__fish_gitmove_using_command init" -l config -d "Chemin vers un fichier de configuration à utiliser comme base" -r
-
-# Sous-commandes et options pour 'config'
-complete -f -c gitmove -n "__fish_gitmove_using_command config" -a "generate" -d "Génère un exemple de fichier de configuration"
-complete -f -c gitmove -n "__fish_gitmove_using_command config" -a "validate" -d "Valide le fichier de configuration"
-complete -f -c gitmove -n "__fish_gitmove_using_subcommand config generate" -s o -l output -d "Chemin de sortie pour l'exemple de configuration" -r
-complete -f -c gitmove -n "__fish_gitmove_using_subcommand config validate" -s c -l config -d "Chemin du fichier de configuration" -r
+def _file_has_content(path: str, content: str) -> bool:
+    """
+    Vérifie si un fichier existe avec exactement le contenu donné.
+    
+    Args:
+        path: Chemin du fichier
+        content: Contenu attendu
+        
+    Returns:
+        True si le fichier a déjà ce contenu, False sinon
+    """
+    try:
+        with open(path, 'r') as f:
+            return f.read() == content
+    except (OSError, UnicodeDecodeError):
+        return False
 
-# Sous-commandes et options pour 'cicd'
-complete -f -c gitmove -n "__fish_gitmove_using_command cicd" -a "generate-workflow" -d "Génère un workflow CI/CD"
-complete -f -c gitmove -n "__fish_gitmove_using_command cicd" -a "validate-branch" -d "Valide un nom de branche"
-complete -f -c gitmove -n "__fish_gitmove_using_command cicd" -a "workflow-report" -d "Génère un rapport sur les workflows"
-complete -f -c gitmove -n "__fish_gitmove_using_subcommand cicd generate-workflow" -l platform -d "Plateforme CI/CD cible" -a "github_actions gitlab_ci jenkins travis_ci circleci"
-complete -f -c gitmove -n "__fish_gitmove_using_subcommand cicd generate-workflow" -s o -l output -d "Chemin de sortie pour le fichier de workflow" -r
-complete -f -c gitmove -n "__fish_gitmove_using_subcommand cicd validate-branch" -a "(__fish_gitmove_branches)"
-complete -f -c gitmove -n "__fish_gitmove_using_subcommand cicd workflow-report" -s o -l output -d "Chemin de sortie pour le rapport" -r
+def _write_file_atomically(path: str, content: str):
+    """
+    Écrit un fichier via un fichier temporaire mis en place avec os.replace().
+    
+    Args:
+        path: Chemin du fichier
+        content: Contenu à écrire
+    """
+    # tempfile n'est utile qu'à l'installation, pas à chaque complétion
+    import tempfile
+    
+    f = tempfile.NamedTemporaryFile(
+        mode='w',
+        dir=os.path.dirname(path),
+        prefix='.gitmove-completion-',
+        delete=False
+    )
+    try:
+        with f:
+            f.write(content)
+        os.chmod(f.name, 0o644)
+        os.replace(f.name, path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
 
-# Sous-commandes et options pour 'env'
-complete -f -c gitmove -n "__fish_gitmove_using_command env" -a "generate-template" -d "Génère un modèle de variables d'environnement"
-complete -f -c gitmove -n "__fish_gitmove_using_command env" -a "validate" -d "Valide les variables d'environnement"
-complete -f -c gitmove -n "__fish_gitmove_using_command env" -a "list" -d "Liste les variables d'environnement GitMove"
-complete -f -c gitmove -n "__fish_gitmove_using_subcommand env generate-template" -s o -l output -d "Chemin de sortie pour le modèle" -r
-complete -f -c gitmove -n "__fish_gitmove_using_subcommand env validate" -l prefix -d "Préfixe des variables d'environnement"
-"""
+# Type de shell pris en charge pour chaque nom d'exécutable de shell
+_SHELL_TYPES = {
+    'bash': 'bash',
+    'rbash': 'bash',
+    'zsh': 'zsh',
+    'fish': 'fish',
+}
 
 def install_completion(shell_type: str = 'auto') -> Tuple[bool, str]:
     """
     Installe le script d'auto-complétion pour le shell spécifié.
     
+    Les installations du package fournissent déjà ces scripts dans
+    share/bash-completion, share/zsh et share/fish ; cette fonction les
+    installe dans le répertoire de l'utilisateur.
+    
     Args:
         shell_type: Type de shell ('bash', 'zsh', 'fish', 'auto')
         
     Returns:
         Tuple (succès, message)
     """
-    # Détection automatique du shell
+    # Détection automatique du shell, d'après le nom de l'exécutable
+    # (sans suffixe de version, ex. bash-5.2)
     if shell_type == 'auto':
         shell_path = os.environ.get('SHELL', '')
-        if 'bash' in shell_path:
-            shell_type = 'bash'
-        elif 'zsh' in shell_path:
-            shell_type = 'zsh'
-        elif 'fish' in shell_path:
-            shell_type = 'fish'
-        else:
+        shell_name = os.path.basename(shell_path).partition('-')[0]
+        shell_type = _SHELL_TYPES.get(shell_name)
+        if shell_type is None:
             return False, f"Shell non reconnu: {shell_path}"
     
     # Générer le contenu du script d'auto-complétion
@@ -439,31 +158,158 @@ def install_completion(shell_type: str = 'auto') -> Tuple[bool, str]:
     # Créer le répertoire si nécessaire
     os.makedirs(os.path.dirname(completion_path), exist_ok=True)
     
-    # Écrire le script d'auto-complétion
+    # Écrire le script d'auto-complétion dans un fichier temporaire, puis le
+    # mettre en place atomiquement : un shell ne lit jamais un script partiel.
+    # Un script déjà à jour n'est pas réécrit (sa date reste inchangée).
     try:
-        with open(completion_path, 'w') as f:
-            f.write(completion_content)
+        if not _file_has_content(completion_path, completion_content):
+            _write_file_atomically(completion_path, completion_content)
     except Exception as e:
         return False, f"Erreur lors de l'écriture du script d'auto-complétion: {str(e)}"
     
     # Ajouter la ligne d'importation dans le fichier RC si nécessaire
     if source_line and rc_file:
         try:
-            # Vérifier si la ligne existe déjà
-            if os.path.exists(rc_file):
-                with open(rc_file, 'r') as f:
-                    content = f.read()
+            # Une seule ouverture pour la lecture et l'ajout ; le mode 'a+'
+            # crée le fichier s'il n'existe pas et écrit toujours à la fin
+            with open(rc_file, 'a+') as f:
+                f.seek(0)
+                content = f.read()
                 if source_line not in content:
-                    with open(rc_file, 'a') as f:
-                        f.write(f"\n# GitMove auto-completion\n{source_line}\n")
-            else:
-                with open(rc_file, 'w') as f:
-                    f.write(f"# GitMove auto-completion\n{source_line}\n")
+                    separator = "\n" if content else ""
+                    f.write(f"{separator}# GitMove auto-completion\n{source_line}\n")
         except Exception as e:
             return False, f"Erreur lors de la mise à jour du fichier RC: {str(e)}"
     
     return True, f"Script d'auto-complétion installé pour {shell_type} dans {completion_path}"
 
+class Suggestion(NamedTuple):
+    """
+    Suggestion de commande GitMove (enregistrement immuable).
+    
+    Les champs restent accessibles comme les clés d'un dictionnaire
+    (``suggestion['title']``) pour les appelants existants.
+    """
+    title: str
+    description: str
+    command: str
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+# Durée de validité des suggestions mises en cache (secondes)
+_SUGGESTIONS_TTL = 30
+
+# Modèles de suggestions : (titre, description à formater, commande)
+_CLEAN_SUGGESTION = (
+    'Nettoyage des branches fusionnées',
+    "Il y a %s branches fusionnées qui pourraient être nettoyées.",
+    'gitmove clean',
+)
+_SYNC_SUGGESTION = (
+    'Mettre à jour la branche',
+    "La branche '%s' est en retard de %s commits.",
+    'gitmove sync',
+)
+_CONFLICTS_SUGGESTION = (
+    'Vérifier les conflits potentiels',
+    "Votre branche et la branche principale ont divergé (%s et %s commits).",
+    'gitmove check-conflicts',
+)
+_ADVICE_SUGGESTION = (
+    'Obtenir un conseil de stratégie',
+    "Vous avez %s commits locaux. Quelle stratégie utiliser pour les intégrer ?",
+    'gitmove advice',
+)
+
+# Suggestion de statut détaillé, toujours proposée et sans paramètre
+_STATUS_SUGGESTION = Suggestion(
+    'Afficher un statut détaillé',
+    "Obtenez une vue détaillée de l'état des branches.",
+    'gitmove status --detailed',
+)
+
+def _make_suggestion(template: Tuple[str, str, str], *args) -> Suggestion:
+    """
+    Construit une suggestion à partir de son modèle.
+    
+    Args:
+        template: Modèle (titre, description à formater, commande)
+        *args: Valeurs insérées dans la description
+        
+    Returns:
+        Suggestion correspondante
+    """
+    title, description, command = template
+    return Suggestion(title, description % args, command)
+
+@lru_cache(maxsize=64)
+def _compute_suggestions(
+    current_branch: Optional[str],
+    ahead_commits: int,
+    behind_commits: int,
+    merged_branches_count: int,
+    time_bucket: int
+) -> Tuple[Suggestion, ...]:
+    """
+    Calcule les suggestions pour un état de dépôt donné.
+    
+    Le résultat est mis en cache par état ; ``time_bucket`` change toutes les
+    ``_SUGGESTIONS_TTL`` secondes et limite ainsi la durée de vie du cache.
+    
+    Args:
+        current_branch: Branche courante
+        ahead_commits: Nombre de commits en avance sur la branche principale
+        behind_commits: Nombre de commits en retard sur la branche principale
+        merged_branches_count: Nombre de branches fusionnées
+        time_bucket: Fenêtre de temps courante
+        
+    Returns:
+        Suggestions pour cet état
+    """
+    suggestions = []
+    
+    # Suggestion de nettoyage
+    if merged_branches_count > 0:
+        suggestions.append(_make_suggestion(_CLEAN_SUGGESTION, merged_branches_count))
+    
+    # Suggestion de synchronisation
+    if behind_commits > 0:
+        suggestions.append(_make_suggestion(_SYNC_SUGGESTION, current_branch, behind_commits))
+    
+    # Suggestion de conflits
+    if behind_commits > 0 and ahead_commits > 0:
+        suggestions.append(_make_suggestion(_CONFLICTS_SUGGESTION, ahead_commits, behind_commits))
+    
+    # Suggestion de conseil pour la stratégie
+    if ahead_commits > 0:
+        suggestions.append(_make_suggestion(_ADVICE_SUGGESTION, ahead_commits))
+    
+    # Suggestion de statut détaillé
+    suggestions.append(_STATUS_SUGGESTION)
+    
+    return tuple(suggestions)
+
+def _resolve(value: Any, default: Any = None) -> Any:
+    """
+    Renvoie une valeur de contexte, en appelant son fournisseur si besoin.
+    
+    Args:
+        value: Valeur, ou fonction sans argument qui la calcule
+        default: Valeur renvoyée si la valeur est absente (None)
+        
+    Returns:
+        Valeur résolue
+    """
+    if callable(value):
+        value = value()
+    return default if value is None else value
+
 class SuggestionEngine:
     """
     Moteur de suggestions pour les commandes GitMove.
@@ -471,116 +317,31 @@ class SuggestionEngine:
     Fournit des suggestions intelligentes basées sur l'état du dépôt.
     """
     
-    def __init__(self):
-        """Initialise le moteur de suggestions."""
-        self.suggestions_cache = {}
-    
-    def get_suggestions(self, context: Dict) -> List[Dict]:
+    def get_suggestions(self, context: Dict) -> Tuple[Suggestion, ...]:
         """
         Obtient des suggestions dans un contexte donné.
         
-        Args:
-            context: Dictionnaire avec des informations contextuelles
-            
-        Returns:
-            Liste de suggestions (dictionnaires avec title, description, command)
-        """
-        suggestions = []
-        
-        # Utiliser le cache si disponible et récent
-        if self._is_cache_valid(context):
-            return self.suggestions_cache.get('suggestions', [])
-        
-        repo_state = context.get('repo_state', {})
-        current_branch = repo_state.get('current_branch')
-        is_clean = repo_state.get('is_clean', True)
-        ahead_commits = repo_state.get('ahead_commits', 0)
-        behind_commits = repo_state.get('behind_commits', 0)
-        
-        # Suggestion de nettoyage
-        if context.get('merged_branches_count', 0) > 0:
-            suggestions.append({
-                'title': 'Nettoyage des branches fusionnées',
-                'description': f"Il y a {context['merged_branches_count']} branches fusionnées qui pourraient être nettoyées.",
-                'command': 'gitmove clean',
-            })
-        
-        # Suggestion de synchronisation
-        if behind_commits > 0:
-            suggestions.append({
-                'title': 'Mettre à jour la branche',
-                'description': f"La branche '{current_branch}' est en retard de {behind_commits} commits.",
-                'command': 'gitmove sync',
-            })
-        
-        # Suggestion de conflits
-        if behind_commits > 0 and ahead_commits > 0:
-            suggestions.append({
-                'title': 'Vérifier les conflits potentiels',
-                'description': f"Votre branche et la branche principale ont divergé ({ahead_commits} et {behind_commits} commits).",
-                'command': 'gitmove check-conflicts',
-            })
+        Les suggestions sont mises en cache par état du dépôt pendant
+        ``_SUGGESTIONS_TTL`` secondes.
         
-        # Suggestion de conseil pour la stratégie
-        if ahead_commits > 0:
-            suggestions.append({
-                'title': 'Obtenir un conseil de stratégie',
-                'description': f"Vous avez {ahead_commits} commits locaux. Quelle stratégie utiliser pour les intégrer ?",
-                'command': 'gitmove advice',
-            })
-        
-        # Suggestion de statut détaillé
-        suggestions.append({
-            'title': 'Afficher un statut détaillé',
-            'description': "Obtenez une vue détaillée de l'état des branches.",
-            'command': 'gitmove status --detailed',
-        })
-        
-        # Mettre à jour le cache
-        self._update_cache(context, suggestions)
-        
-        return suggestions
-    
-    def _is_cache_valid(self, context: Dict) -> bool:
-        """
-        Vérifie si le cache est valide pour le contexte actuel.
+        Les valeurs coûteuses (``merged_branches_count``, ``ahead_commits``,
+        ``behind_commits``) peuvent être fournies sous forme de fonctions sans
+        argument : elles ne sont appelées que lorsque des suggestions sont
+        effectivement demandées, et le cache porte sur les valeurs qu'elles
+        renvoient.
         
         Args:
-            context: Contexte actuel
+            context: Dictionnaire avec des informations contextuelles
             
         Returns:
-            True si le cache est valide, False sinon
+            Suggestions (enregistrements avec title, description, command)
         """
-        if not self.suggestions_cache:
-            return False
-            
-        # Vérifier que le contexte n'a pas changé
-        cache_context = self.suggestions_cache.get('context', {})
-        
-        # Comparer les éléments clés
-        for key in ['repo_state', 'merged_branches_count']:
-            if context.get(key) != cache_context.get(key):
-                return False
-        
-        # Vérifier l'âge du cache (30 secondes max)
-        cache_time = self.suggestions_cache.get('timestamp', 0)
-        current_time = time.time()
-        if current_time - cache_time > 30:
-            return False
-        
-        return True
-    
-    def _update_cache(self, context: Dict, suggestions: List[Dict]):
-        """
-        Met à jour le cache de suggestions.
+        repo_state = context.get('repo_state', {})
         
-        Args:
-            context: Contexte actuel
-            suggestions: Suggestions générées
-        """
-        import time
-        self.suggestions_cache = {
-            'context': context,
-            'suggestions': suggestions,
-            'timestamp': time.time()
-        }
\ No newline at end of file
+        return _compute_suggestions(
+            _resolve(repo_state.get('current_branch')),
+            _resolve(repo_state.get('ahead_commits'), 0),
+            _resolve(repo_state.get('behind_commits'), 0),
+            _resolve(context.get('merged_branches_count'), 0),
+            int(time.monotonic() // _SUGGESTIONS_TTL)
+        )
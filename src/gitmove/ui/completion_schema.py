@@ -0,0 +1,684 @@
+"""
+Schéma des commandes GitMove pour l'auto-complétion.
+
+Les scripts d'auto-complétion Bash, Zsh et Fish livrés dans
+gitmove/ui/completions sont générés à partir de ce schéma unique, afin que
+les trois shells proposent les mêmes commandes et options. Après une
+modification du schéma, regénérer les scripts avec :
+
+    python -m gitmove.ui.completion_schema
+"""
+
+import os
+from typing import NamedTuple, Optional, Tuple
+
+# Types de valeur des options et arguments
+BRANCH = 'branch'
+FILE = 'file'
+TEXT = 'text'
+
+# Libellé par défaut de la valeur (messages Zsh)
+_VALUE_LABELS = {
+    BRANCH: 'branche',
+    FILE: 'fichier',
+}
+
+class OptionSpec(NamedTuple):
+    """
+    Option d'une commande.
+    
+    ``names`` commence par le nom long ; ``value`` vaut None pour un
+    drapeau, sinon BRANCH, FILE ou TEXT (ou TEXT avec ``choices``).
+    """
+    names: Tuple[str, ...]
+    description: str
+    value: Optional[str] = None
+    choices: Tuple[str, ...] = ()
+    label: str = ''
+    repeatable: bool = False
+
+class CommandSpec(NamedTuple):
+    """
+    Commande (ou sous-commande) GitMove.
+    
+    ``argument`` est le type de l'argument positionnel éventuel ;
+    ``subcommands`` est une suite de paires (nom, CommandSpec).
+    """
+    description: str
+    options: Tuple[OptionSpec, ...] = ()
+    subcommands: Tuple[Tuple[str, 'CommandSpec'], ...] = ()
+    subcommands_title: str = ''
+    argument: Optional[str] = None
+
+GLOBAL_OPTIONS = (
+    OptionSpec(('--verbose', '-v'), "Affiche des informations détaillées"),
+    OptionSpec(('--quiet', '-q'), "Minimise les sorties"),
+    OptionSpec(('--config', '-c'), "Spécifie un fichier de configuration alternatif", FILE),
+    OptionSpec(('--help', '-h'), "Affiche l'aide"),
+    OptionSpec(('--version',), "Affiche la version"),
+)
+
+COMMANDS = (
+    ('clean', CommandSpec(
+        "Nettoie les branches fusionnées",
+        options=(
+            OptionSpec(('--remote',), "Nettoie également les branches distantes"),
+            OptionSpec(('--dry-run',), "Simule l'opération sans effectuer de changements"),
+            OptionSpec(('--force', '-f'), "Ne pas demander de confirmation"),
+            OptionSpec(('--exclude',), "Branches à exclure du nettoyage", BRANCH, repeatable=True),
+        ),
+    )),
+    ('sync', CommandSpec(
+        "Synchronise la branche courante avec la principale",
+        options=(
+            OptionSpec(('--strategy',), "Stratégie de synchronisation à utiliser", TEXT,
+                       choices=('merge', 'rebase', 'auto'), label='stratégie'),
+            OptionSpec(('--branch',), "Branche à synchroniser", BRANCH),
+        ),
+    )),
+    ('advice', CommandSpec(
+        "Suggère une stratégie pour fusionner/rebaser",
+        options=(
+            OptionSpec(('--branch',), "Branche à analyser", BRANCH),
+            OptionSpec(('--target',), "Branche cible", BRANCH),
+        ),
+    )),
+    ('check-conflicts', CommandSpec(
+        "Détecte les conflits potentiels",
+        options=(
+            OptionSpec(('--branch',), "Branche à vérifier", BRANCH),
+            OptionSpec(('--target',), "Branche cible", BRANCH),
+        ),
+    )),
+    ('init', CommandSpec(
+        "Initialise la configuration de gitmove pour le dépôt",
+        options=(
+            OptionSpec(('--config',), "Chemin vers un fichier de configuration à utiliser comme base", FILE),
+        ),
+    )),
+    ('status', CommandSpec(
+        "Affiche l'état actuel des branches et recommandations",
+        options=(
+            OptionSpec(('--detailed',), "Affiche des informations détaillées"),
+        ),
+    )),
+    ('config', CommandSpec(
+        "Commandes de gestion de configuration",
+        subcommands_title="Commandes de configuration",
+        subcommands=(
+            ('generate', CommandSpec(
+                "Génère un exemple de fichier de configuration",
+                options=(
+                    OptionSpec(('--output', '-o'), "Chemin de sortie pour l'exemple de configuration", FILE),
+                ),
+            )),
+            ('validate', CommandSpec(
+                "Valide le fichier de configuration",
+                options=(
+                    OptionSpec(('--config', '-c'), "Chemin du fichier de configuration", FILE),
+                ),
+            )),
+        ),
+    )),
+    ('cicd', CommandSpec(
+        "Commandes de gestion CI/CD",
+        subcommands_title="Commandes CI/CD",
+        subcommands=(
+            ('generate-workflow', CommandSpec(
+                "Génère un workflow CI/CD",
+                options=(
+                    OptionSpec(('--platform',), "Plateforme CI/CD cible", TEXT,
+                               choices=('github_actions', 'gitlab_ci', 'jenkins', 'travis_ci', 'circleci'),
+                               label='plateforme'),
+                    OptionSpec(('--output', '-o'), "Chemin de sortie pour le fichier de workflow", FILE),
+                ),
+            )),
+            ('validate-branch', CommandSpec(
+                "Valide un nom de branche",
+                argument=BRANCH,
+            )),
+            ('workflow-report', CommandSpec(
+                "Génère un rapport sur les workflows",
+                options=(
+                    OptionSpec(('--output', '-o'), "Chemin de sortie pour le rapport", FILE),
+                ),
+            )),
+        ),
+    )),
+    ('env', CommandSpec(
+        "Commandes de gestion des variables d'environnement",
+        subcommands_title="Commandes de gestion des variables d'environnement",
+        subcommands=(
+            ('generate-template', CommandSpec(
+                "Génère un modèle de variables d'environnement",
+                options=(
+                    OptionSpec(('--output', '-o'), "Chemin de sortie pour le modèle", FILE),
+                ),
+            )),
+            ('validate', CommandSpec(
+                "Valide les variables d'environnement",
+                options=(
+                    OptionSpec(('--prefix',), "Préfixe des variables d'environnement", TEXT, label='préfixe'),
+                ),
+            )),
+            ('list', CommandSpec(
+                "Liste les variables d'environnement GitMove",
+            )),
+        ),
+    )),
+    ('detect-ci', CommandSpec(
+        "Détecte l'environnement CI courant",
+    )),
+)
+
+# Fonctions d'aide communes des scripts Bash et Fish (listes de branches)
+_BASH_HELPERS = r"""
+# Branches lues directement dans le dépôt (références non empaquetées puis
+# packed-refs), ajoutées au tableau lines de l'appelant avec les seules
+# commandes internes de bash. Code de retour 1 si le dépôt n'a pas la
+# disposition classique (reftable, worktree...) : git doit alors être interrogé.
+__gitmove_read_branches() {
+    local git_dir="$1" heads="$1/refs/heads/" ref sha globstar=0
+    local -A seen=()
+    
+    [[ -d "$heads" && ! -e "$git_dir/reftable" && ! -e "$git_dir/commondir" ]] || return 1
+    
+    shopt -q globstar || { shopt -s globstar; globstar=1; }
+    for ref in "$heads"**; do
+        [[ -f "$ref" && "$ref" != *.lock ]] && seen["${ref#"$heads"}"]=1
+    done
+    (( globstar )) && shopt -u globstar
+    
+    if [[ -r "$git_dir/packed-refs" ]]; then
+        while read -r sha ref; do
+            [[ "$ref" == refs/heads/* ]] && seen["${ref#refs/heads/}"]=1
+        done < "$git_dir/packed-refs"
+    fi
+    lines+=( "${!seen[@]}" )
+    return 0
+}
+
+# Branches locales du dépôt courant commençant par $1, placées directement
+# dans COMPREPLY (pas de sous-shell). La liste est partagée entre les shells
+# par un fichier de cache de courte durée (2 s), invalidé dès que HEAD,
+# packed-refs ou refs/heads changent ; sa vérification et sa lecture
+# n'utilisent que des commandes internes de bash, et la liste elle-même est
+# lue dans le dépôt sans lancer git quand c'est possible.
+__gitmove_branches() {
+    local cur="$1" git_dir cache now
+    local -a lines
+    
+    COMPREPLY=()
+    if [[ "$__gitmove_git_dir_pwd" != "$PWD" ]]; then
+        __gitmove_git_dir=$(git rev-parse --absolute-git-dir 2>/dev/null)
+        __gitmove_git_dir_pwd="$PWD"
+    fi
+    git_dir="$__gitmove_git_dir"
+    [[ -n "$git_dir" ]] || return 0
+    
+    cache="${XDG_CACHE_HOME:-$HOME/.cache}/gitmove/branches-${git_dir//\//_}"
+    printf -v now '%(%s)T' -1
+    
+    if [[ -r "$cache" && "$cache" -nt "$git_dir/HEAD" && "$cache" -nt "$git_dir/refs/heads" ]] &&
+       [[ ! -e "$git_dir/packed-refs" || "$cache" -nt "$git_dir/packed-refs" ]]; then
+        mapfile -t lines < "$cache"
+    fi
+    if (( ${lines[0]:-0} + 2 <= now )); then
+        lines=( "$now" )
+        __gitmove_read_branches "$git_dir" ||
+            mapfile -t -O 1 lines < <(git for-each-ref --format='%(refname:short)' refs/heads 2>/dev/null)
+        mkdir -p "${cache%/*}" 2>/dev/null &&
+            printf '%s\n' "${lines[@]}" > "$cache.$$" 2>/dev/null &&
+            mv -f "$cache.$$" "$cache" 2>/dev/null
+    fi
+    
+    # Sans préfixe, la liste est la réponse ; sinon seul compgen filtre
+    if [[ -z "$cur" ]]; then
+        COMPREPLY=( "${lines[@]:1}" )
+    else
+        mapfile -t COMPREPLY < <(compgen -W "${lines[*]:1}" -- "$cur")
+    fi
+    return 0
+}
+"""
+
+_FISH_HELPERS = r"""
+# Branches lues directement dans le dépôt (références non empaquetées et
+# packed-refs), sans lancer git. Code de retour 1 si le dépôt n'a pas la
+# disposition classique (reftable, worktree...) : git doit alors être interrogé.
+function __fish_gitmove_read_branches -a git_dir
+    test -d $git_dir/refs/heads; and not test -e $git_dir/reftable; and not test -e $git_dir/commondir
+    or return 1
+    
+    set -l branches
+    for ref in $git_dir/refs/heads/**
+        test -f $ref; and set -a branches (string replace -- $git_dir/refs/heads/ '' $ref)
+    end
+    if test -r $git_dir/packed-refs
+        set -a branches (string replace -rf '^[0-9a-f]+ refs/heads/' '' < $git_dir/packed-refs)
+    end
+    if set -q branches[1]
+        printf '%s\n' $branches | string match -v -- '*.lock' | sort -u
+    end
+end
+
+# Branches locales, conservées tant que le répertoire et les dates de
+# modification des références (HEAD, packed-refs, refs/heads) sont inchangés.
+# La liste est aussi partagée entre les shells par un fichier de cache de
+# courte durée (2 s) : git n'est lancé qu'une fois par fenêtre de 2 s.
+# Fish rappelle cette fonction à chaque frappe pendant la complétion : tant
+# que la ligne de commande n'a pas changé, la liste est renvoyée telle quelle.
+function __fish_gitmove_branches
+    set -l buffer (commandline -b | string collect)
+    if set -q __fish_gitmove_branches_cache; and test "$__fish_gitmove_branches_buffer" = "$PWD $buffer"
+        printf '%s\n' $__fish_gitmove_branches_cache
+        return 0
+    end
+    if test "$__fish_gitmove_git_dir_pwd" != "$PWD"
+        set -g __fish_gitmove_git_dir (git rev-parse --absolute-git-dir 2>/dev/null)
+        set -g __fish_gitmove_git_dir_pwd $PWD
+    end
+    test -n "$__fish_gitmove_git_dir"; or return 0
+    
+    # Format de date de modification de stat (GNU ou BSD), détecté une fois
+    if not set -q __fish_gitmove_stat_format
+        if stat -c %Y / >/dev/null 2>&1
+            set -g __fish_gitmove_stat_format -c %Y
+        else
+            set -g __fish_gitmove_stat_format -f %m
+        end
+    end
+    
+    set -l refs $__fish_gitmove_git_dir/HEAD $__fish_gitmove_git_dir/packed-refs $__fish_gitmove_git_dir/refs/heads
+    set -l key "$PWD" (stat $__fish_gitmove_stat_format $refs 2>/dev/null)
+    if test "$__fish_gitmove_branches_key" != "$key"
+        set -l cache_home $HOME/.cache
+        set -q XDG_CACHE_HOME; and set cache_home $XDG_CACHE_HOME
+        set -l cache $cache_home/gitmove/branches-(string replace -a / _ -- $__fish_gitmove_git_dir)
+        set -l now (date +%s)
+        
+        # Fichier de cache : date d'écriture, clé des références, branches
+        set -l lines
+        if test -r $cache
+            while read -l line
+                set -a lines $line
+            end < $cache
+        end
+        
+        if test (count $lines) -ge 2; and test "$lines[2]" = "$key"; and test (math "$lines[1] + 2") -gt $now
+            set -g __fish_gitmove_branches_cache $lines[3..-1]
+        else
+            set -g __fish_gitmove_branches_cache (__fish_gitmove_read_branches $__fish_gitmove_git_dir
+                or git for-each-ref --format="%(refname:short)" refs/heads 2>/dev/null)
+            mkdir -p (dirname $cache) 2>/dev/null
+            and printf '%s\n' $now "$key" $__fish_gitmove_branches_cache > $cache.$fish_pid 2>/dev/null
+            and mv -f $cache.$fish_pid $cache 2>/dev/null
+        end
+        set -g __fish_gitmove_branches_key "$key"
+    end
+    set -g __fish_gitmove_branches_buffer "$PWD $buffer"
+    printf '%s\n' $__fish_gitmove_branches_cache
+end
+
+function __fish_gitmove_needs_command
+    set -l cmd (commandline -opc)
+    if [ (count $cmd) -eq 1 ]
+        return 0
+    end
+    return 1
+end
+
+function __fish_gitmove_using_command
+    set -l cmd (commandline -opc)
+    if [ (count $cmd) -gt 1 ]
+        if [ $argv[1] = $cmd[2] ]
+            return 0
+        end
+    end
+    return 1
+end
+
+function __fish_gitmove_using_subcommand
+    set -l cmd (commandline -opc)
+    if [ (count $cmd) -gt 2 ]
+        if [ $argv[1] = $cmd[2] -a $argv[2] = $cmd[3] ]
+            return 0
+        end
+    end
+    return 1
+end
+"""
+
+def _words(options: Tuple[OptionSpec, ...]) -> str:
+    """Noms de toutes les options, séparés par des espaces."""
+    return ' '.join(name for option in options for name in option.names)
+
+def _bash_value(value: str, choices: Tuple[str, ...]) -> str:
+    """Valeur proposée par Bash : liste de choix ou @branch, @file, @text."""
+    return ' '.join(choices) if choices else f'@{value}'
+
+def _bash_tables() -> Tuple[list, list, list, list]:
+    """
+    Tables de complétion Bash, indexées par commande (``cmd`` ou ``cmd:sub``).
+    
+    Returns:
+        Entrées des tableaux sous-commandes, options, valeurs et arguments
+    """
+    subcommands, options, values, arguments = [], [], [], []
+    entries = []
+    for name, spec in COMMANDS:
+        if spec.subcommands:
+            subcommands.append((name, ' '.join(sub for sub, _ in spec.subcommands)))
+            entries.extend((f'{name}:{sub}', sub_spec) for sub, sub_spec in spec.subcommands)
+        else:
+            entries.append((name, spec))
+    
+    for key, spec in entries:
+        if spec.options:
+            options.append((key, _words(spec.options)))
+        for option in spec.options:
+            if option.value:
+                value = _bash_value(option.value, option.choices)
+                values.extend((f'{key}:{name}', value) for name in option.names)
+        if spec.argument:
+            arguments.append((key, _bash_value(spec.argument, ())))
+    return subcommands, options, values, arguments
+
+def _bash_array(name: str, entries: list) -> list:
+    """Déclaration d'un tableau associatif Bash en lecture seule."""
+    lines = [f'    declare -gAr {name}=(']
+    lines.extend(f'        [{key}]="{value}"' for key, value in entries)
+    lines.append('    )')
+    return lines
+
+def render_bash() -> str:
+    """
+    Génère le script d'auto-complétion Bash.
+    
+    Les commandes, options et valeurs sont déclarées une fois au chargement
+    du script dans des tableaux associatifs ; chaque complétion n'est plus
+    qu'une recherche dans ces tableaux.
+    
+    Returns:
+        Contenu du script
+    """
+    subcommands, options, values, arguments = _bash_tables()
+    lines = [
+        '# GitMove bash completion script',
+        '',
+        _BASH_HELPERS.strip('\n'),
+        '',
+        '# Données de complétion, initialisées une seule fois au chargement du script',
+        '# (clés : commande ou commande:sous-commande, suivie de :option pour les',
+        '# valeurs ; @branch, @file et @text désignent le type de valeur attendu)',
+        'if ! declare -p _GITMOVE_OPTS &>/dev/null; then',
+        f'    declare -gr _GITMOVE_COMMANDS="{" ".join(name for name, _ in COMMANDS)}"',
+        f'    declare -gr _GITMOVE_GLOBAL_OPTS="{_words(GLOBAL_OPTIONS)}"',
+    ]
+    lines.extend(_bash_array('_GITMOVE_SUBCOMMANDS', subcommands))
+    lines.extend(_bash_array('_GITMOVE_OPTS', options))
+    lines.extend(_bash_array('_GITMOVE_VALUES', values))
+    lines.extend(_bash_array('_GITMOVE_ARGS', arguments))
+    lines.extend([
+        'fi',
+        '',
+        '_gitmove_completion() {',
+        '    local cur prev key value',
+        '    COMPREPLY=()',
+        '    cur="${COMP_WORDS[COMP_CWORD]}"',
+        '    prev="${COMP_WORDS[COMP_CWORD-1]}"',
+        '    ',
+        '    # Commandes principales ou options globales',
+        '    if (( COMP_CWORD == 1 )); then',
+        '        if [[ "$cur" == -* ]]; then',
+        '            mapfile -t COMPREPLY < <(compgen -W "${_GITMOVE_GLOBAL_OPTS}" -- "${cur}")',
+        '        else',
+        '            mapfile -t COMPREPLY < <(compgen -W "${_GITMOVE_COMMANDS}" -- "${cur}")',
+        '        fi',
+        '        return 0',
+        '    fi',
+        '    ',
+        '    # Sous-commandes',
+        '    key="${COMP_WORDS[1]:-_}"',
+        '    if [[ -n "${_GITMOVE_SUBCOMMANDS[$key]+set}" ]]; then',
+        '        if (( COMP_CWORD == 2 )); then',
+        '            mapfile -t COMPREPLY < <(compgen -W "${_GITMOVE_SUBCOMMANDS[$key]}" -- "${cur}")',
+        '            return 0',
+        '        fi',
+        '        key+=":${COMP_WORDS[2]}"',
+        '    fi',
+        '    ',
+        '    # Valeur de l\'option précédente, argument positionnel ou options',
+        '    value="${_GITMOVE_VALUES[$key:$prev]-}"',
+        '    if [[ -z "$value" && "$cur" != -* ]]; then',
+        '        value="${_GITMOVE_ARGS[$key]-}"',
+        '    fi',
+        '    case "$value" in',
+        '        @branch)',
+        '            __gitmove_branches "${cur}"',
+        '            ;;',
+        '        @file)',
+        '            mapfile -t COMPREPLY < <(compgen -f -- "${cur}")',
+        '            ;;',
+        '        @text)',
+        '            ;;',
+        '        "")',
+        '            mapfile -t COMPREPLY < <(compgen -W "${_GITMOVE_OPTS[$key]-}" -- "${cur}")',
+        '            ;;',
+        '        *)',
+        '            mapfile -t COMPREPLY < <(compgen -W "${value}" -- "${cur}")',
+        '            ;;',
+        '    esac',
+        '    return 0',
+        '}',
+        '',
+        '# Enregistrement de la fonction de complétion',
+        'complete -F _gitmove_completion gitmove',
+        '',
+    ])
+    return '\n'.join(lines)
+
+def _zsh_quote(text: str) -> str:
+    """Entoure un texte d'apostrophes pour Zsh."""
+    return "'" + text.replace("'", "'\\''") + "'"
+
+def _zsh_option_specs(option: OptionSpec) -> list:
+    """Spécifications _arguments d'une option (une par nom)."""
+    if option.choices:
+        action = f"({' '.join(option.choices)})"
+    elif option.value == BRANCH:
+        action = '_git_branch_names'
+    elif option.value == FILE:
+        action = '_files'
+    else:
+        action = ''
+    
+    label = option.label or _VALUE_LABELS.get(option.value, '')
+    specs = []
+    for name in option.names:
+        spec = '*' if option.repeatable else ''
+        if option.value:
+            spec += f"{name}{'=' if name.startswith('--') else ''}[{option.description}]:{label}"
+            if action:
+                spec += f':{action}'
+        else:
+            spec += f'{name}[{option.description}]'
+        specs.append(_zsh_quote(spec))
+    return specs
+
+def _zsh_arguments(spec: CommandSpec, indent: str) -> list:
+    """Appel _arguments complétant les options et arguments d'une commande."""
+    specs = [s for option in spec.options for s in _zsh_option_specs(option)]
+    if spec.argument:
+        specs.append(_zsh_quote(f':{_VALUE_LABELS[spec.argument]}:_git_branch_names'))
+    if not specs:
+        return [f'{indent}_message "aucun argument"']
+    lines = [f'{indent}_arguments \\']
+    for i, item in enumerate(specs):
+        lines.append(f'{indent}    {item}' + (' \\' if i < len(specs) - 1 else ''))
+    return lines
+
+def render_zsh() -> str:
+    """
+    Génère le script d'auto-complétion Zsh.
+    
+    Returns:
+        Contenu du script
+    """
+    lines = [
+        '#compdef gitmove',
+        '',
+        '_gitmove() {',
+        '    local -a commands global_options subcommands',
+        '    ',
+        '    commands=(',
+    ]
+    lines.extend(f'        {_zsh_quote(f"{name}:{spec.description}")}' for name, spec in COMMANDS)
+    lines.extend(['    )', '    ', '    global_options=('])
+    lines.extend(f'        {s}' for option in GLOBAL_OPTIONS for s in _zsh_option_specs(option))
+    lines.extend([
+        '    )',
+        '    ',
+        '    _arguments -C \\',
+        '        $global_options \\',
+        "        ': :->command' \\",
+        "        '*:: :->option-or-argument'",
+        '    ',
+        '    case $state in',
+        '        command)',
+        '            _describe -t commands "Commandes GitMove" commands',
+        '            ;;',
+        '        option-or-argument)',
+        '            case $words[1] in',
+    ])
+    for name, spec in COMMANDS:
+        lines.append(f'                {name})')
+        if spec.subcommands:
+            lines.extend([
+                '                    if (( CURRENT == 2 )); then',
+                '                        subcommands=(',
+            ])
+            lines.extend(
+                f'                            {_zsh_quote(f"{sub}:{sub_spec.description}")}'
+                for sub, sub_spec in spec.subcommands
+            )
+            lines.extend([
+                '                        )',
+                f'                        _describe -t subcommands {_zsh_quote(spec.subcommands_title)} subcommands',
+                '                    else',
+                '                        shift words',
+                '                        (( CURRENT-- ))',
+                '                        case $words[1] in',
+            ])
+            for sub_name, sub_spec in spec.subcommands:
+                lines.append(f'                            {sub_name})')
+                lines.extend(_zsh_arguments(sub_spec, ' ' * 32))
+                lines.append('                                ;;')
+            lines.extend([
+                '                        esac',
+                '                    fi',
+            ])
+        else:
+            lines.extend(_zsh_arguments(spec, ' ' * 20))
+        lines.append('                    ;;')
+    lines.extend([
+        '            esac',
+        '            ;;',
+        '    esac',
+        '}',
+        '',
+        '_gitmove "$@"',
+        '',
+    ])
+    return '\n'.join(lines)
+
+def _fish_quote(text: str) -> str:
+    """Entoure un texte de guillemets pour Fish."""
+    escaped = text.replace('\\', '\\\\').replace('"', '\\"').replace('$', '\\$')
+    return f'"{escaped}"'
+
+def _fish_option(option: OptionSpec, condition: Optional[str]) -> str:
+    """Ligne complete Fish d'une option."""
+    parts = ['complete -c gitmove']
+    if condition:
+        parts.append(f'-n {_fish_quote(condition)}')
+    for name in option.names:
+        parts.append(f'-l {name[2:]}' if name.startswith('--') else f'-s {name[1:]}')
+    parts.append(f'-d {_fish_quote(option.description)}')
+    if option.choices:
+        parts.append(f'-x -a {_fish_quote(" ".join(option.choices))}')
+    elif option.value == BRANCH:
+        parts.append('-x -a "(__fish_gitmove_branches)"')
+    elif option.value == FILE:
+        parts.append('-r')
+    elif option.value:
+        parts.append('-x')
+    else:
+        parts.append('-f')
+    return ' '.join(parts)
+
+def _fish_command(name: str, spec: CommandSpec, condition: str) -> list:
+    """Lignes Fish des options et arguments d'une commande."""
+    lines = [_fish_option(option, condition) for option in spec.options]
+    if spec.argument:
+        lines.append(f'complete -c gitmove -n {_fish_quote(condition)} -f -a "(__fish_gitmove_branches)"')
+    return lines
+
+def render_fish() -> str:
+    """
+    Génère le script d'auto-complétion Fish.
+    
+    Returns:
+        Contenu du script
+    """
+    lines = [
+        '# GitMove fish completion',
+        '',
+        _FISH_HELPERS.strip('\n'),
+        '',
+        '# Commandes principales',
+    ]
+    lines.extend(
+        f'complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "{name}" -d {_fish_quote(spec.description)}'
+        for name, spec in COMMANDS
+    )
+    lines.extend(['', '# Options globales'])
+    lines.extend(_fish_option(option, None) for option in GLOBAL_OPTIONS)
+    for name, spec in COMMANDS:
+        if not (spec.options or spec.subcommands or spec.argument):
+            continue
+        lines.extend(['', f"# Options pour '{name}'"])
+        lines.extend(_fish_command(name, spec, f'__fish_gitmove_using_command {name}'))
+        for sub_name, sub_spec in spec.subcommands:
+            lines.append(
+                f'complete -f -c gitmove -n "__fish_gitmove_using_command {name}" '
+                f'-a "{sub_name}" -d {_fish_quote(sub_spec.description)}'
+            )
+        for sub_name, sub_spec in spec.subcommands:
+            lines.extend(_fish_command(sub_name, sub_spec, f'__fish_gitmove_using_subcommand {name} {sub_name}'))
+    lines.append('')
+    return '\n'.join(lines)
+
+# Fichiers générés (dans gitmove/ui/completions) et fonction de rendu
+SCRIPTS = (
+    ('gitmove.bash', render_bash),
+    ('_gitmove', render_zsh),
+    ('gitmove.fish', render_fish),
+)
+
+def write_scripts(directory: Optional[str] = None):
+    """
+    Écrit les scripts d'auto-complétion générés.
+    
+    Args:
+        directory: Répertoire de destination (par défaut gitmove/ui/completions)
+    """
+    if directory is None:
+        directory = os.path.join(os.path.dirname(__file__), 'completions')
+    
+    for name, render in SCRIPTS:
+        with open(os.path.join(directory, name), 'w', encoding='utf-8', newline='\n') as f:
+            f.write(render())
+
+if __name__ == "__main__":
+    write_scripts()
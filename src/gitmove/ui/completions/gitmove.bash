@@ -0,0 +1,174 @@
+# GitMove bash completion script
+
+# Branches lues directement dans le dépôt (références non empaquetées puis
+# packed-refs), ajoutées au tableau lines de l'appelant avec les seules
+# commandes internes de bash. Code de retour 1 si le dépôt n'a pas la
+# disposition classique (reftable, worktree...) : git doit alors être interrogé.
+__gitmove_read_branches() {
+    local git_dir="$1" heads="$1/refs/heads/" ref sha globstar=0
+    local -A seen=()
+    
+    [[ -d "$heads" && ! -e "$git_dir/reftable" && ! -e "$git_dir/commondir" ]] || return 1
+    
+    shopt -q globstar || { shopt -s globstar; globstar=1; }
+    for ref in "$heads"**; do
+        [[ -f "$ref" && "$ref" != *.lock ]] && seen["${ref#"$heads"}"]=1
+    done
+    (( globstar )) && shopt -u globstar
+    
+    if [[ -r "$git_dir/packed-refs" ]]; then
+        while read -r sha ref; do
+            [[ "$ref" == refs/heads/* ]] && seen["${ref#refs/heads/}"]=1
+        done < "$git_dir/packed-refs"
+    fi
+    lines+=( "${!seen[@]}" )
+    return 0
+}
+
+# Branches locales du dépôt courant commençant par $1, placées directement
+# dans COMPREPLY (pas de sous-shell). La liste est partagée entre les shells
+# par un fichier de cache de courte durée (2 s), invalidé dès que HEAD,
+# packed-refs ou refs/heads changent ; sa vérification et sa lecture
+# n'utilisent que des commandes internes de bash, et la liste elle-même est
+# lue dans le dépôt sans lancer git quand c'est possible.
+__gitmove_branches() {
+    local cur="$1" git_dir cache now
+    local -a lines
+    
+    COMPREPLY=()
+    if [[ "$__gitmove_git_dir_pwd" != "$PWD" ]]; then
+        __gitmove_git_dir=$(git rev-parse --absolute-git-dir 2>/dev/null)
+        __gitmove_git_dir_pwd="$PWD"
+    fi
+    git_dir="$__gitmove_git_dir"
+    [[ -n "$git_dir" ]] || return 0
+    
+    cache="${XDG_CACHE_HOME:-$HOME/.cache}/gitmove/branches-${git_dir//\//_}"
+    printf -v now '%(%s)T' -1
+    
+    if [[ -r "$cache" && "$cache" -nt "$git_dir/HEAD" && "$cache" -nt "$git_dir/refs/heads" ]] &&
+       [[ ! -e "$git_dir/packed-refs" || "$cache" -nt "$git_dir/packed-refs" ]]; then
+        mapfile -t lines < "$cache"
+    fi
+    if (( ${lines[0]:-0} + 2 <= now )); then
+        lines=( "$now" )
+        __gitmove_read_branches "$git_dir" ||
+            mapfile -t -O 1 lines < <(git for-each-ref --format='%(refname:short)' refs/heads 2>/dev/null)
+        mkdir -p "${cache%/*}" 2>/dev/null &&
+            printf '%s\n' "${lines[@]}" > "$cache.$$" 2>/dev/null &&
+            mv -f "$cache.$$" "$cache" 2>/dev/null
+    fi
+    
+    # Sans préfixe, la liste est la réponse ; sinon seul compgen filtre
+    if [[ -z "$cur" ]]; then
+        COMPREPLY=( "${lines[@]:1}" )
+    else
+        mapfile -t COMPREPLY < <(compgen -W "${lines[*]:1}" -- "$cur")
+    fi
+    return 0
+}
+
+# Données de complétion, initialisées une seule fois au chargement du script
+# (clés : commande ou commande:sous-commande, suivie de :option pour les
+# valeurs ; @branch, @file et @text désignent le type de valeur attendu)
+if ! declare -p _GITMOVE_OPTS &>/dev/null; then
+    declare -gr _GITMOVE_COMMANDS="clean sync advice check-conflicts init status config cicd env detect-ci"
+    declare -gr _GITMOVE_GLOBAL_OPTS="--verbose -v --quiet -q --config -c --help -h --version"
+    declare -gAr _GITMOVE_SUBCOMMANDS=(
+        [config]="generate validate"
+        [cicd]="generate-workflow validate-branch workflow-report"
+        [env]="generate-template validate list"
+    )
+    declare -gAr _GITMOVE_OPTS=(
+        [clean]="--remote --dry-run --force -f --exclude"
+        [sync]="--strategy --branch"
+        [advice]="--branch --target"
+        [check-conflicts]="--branch --target"
+        [init]="--config"
+        [status]="--detailed"
+        [config:generate]="--output -o"
+        [config:validate]="--config -c"
+        [cicd:generate-workflow]="--platform --output -o"
+        [cicd:workflow-report]="--output -o"
+        [env:generate-template]="--output -o"
+        [env:validate]="--prefix"
+    )
+    declare -gAr _GITMOVE_VALUES=(
+        [clean:--exclude]="@branch"
+        [sync:--strategy]="merge rebase auto"
+        [sync:--branch]="@branch"
+        [advice:--branch]="@branch"
+        [advice:--target]="@branch"
+        [check-conflicts:--branch]="@branch"
+        [check-conflicts:--target]="@branch"
+        [init:--config]="@file"
+        [config:generate:--output]="@file"
+        [config:generate:-o]="@file"
+        [config:validate:--config]="@file"
+        [config:validate:-c]="@file"
+        [cicd:generate-workflow:--platform]="github_actions gitlab_ci jenkins travis_ci circleci"
+        [cicd:generate-workflow:--output]="@file"
+        [cicd:generate-workflow:-o]="@file"
+        [cicd:workflow-report:--output]="@file"
+        [cicd:workflow-report:-o]="@file"
+        [env:generate-template:--output]="@file"
+        [env:generate-template:-o]="@file"
+        [env:validate:--prefix]="@text"
+    )
+    declare -gAr _GITMOVE_ARGS=(
+        [cicd:validate-branch]="@branch"
+    )
+fi
+
+_gitmove_completion() {
+    local cur prev key value
+    COMPREPLY=()
+    cur="${COMP_WORDS[COMP_CWORD]}"
+    prev="${COMP_WORDS[COMP_CWORD-1]}"
+    
+    # Commandes principales ou options globales
+    if (( COMP_CWORD == 1 )); then
+        if [[ "$cur" == -* ]]; then
+            mapfile -t COMPREPLY < <(compgen -W "${_GITMOVE_GLOBAL_OPTS}" -- "${cur}")
+        else
+            mapfile -t COMPREPLY < <(compgen -W "${_GITMOVE_COMMANDS}" -- "${cur}")
+        fi
+        return 0
+    fi
+    
+    # Sous-commandes
+    key="${COMP_WORDS[1]:-_}"
+    if [[ -n "${_GITMOVE_SUBCOMMANDS[$key]+set}" ]]; then
+        if (( COMP_CWORD == 2 )); then
+            mapfile -t COMPREPLY < <(compgen -W "${_GITMOVE_SUBCOMMANDS[$key]}" -- "${cur}")
+            return 0
+        fi
+        key+=":${COMP_WORDS[2]}"
+    fi
+    
+    # Valeur de l'option précédente, argument positionnel ou options
+    value="${_GITMOVE_VALUES[$key:$prev]-}"
+    if [[ -z "$value" && "$cur" != -* ]]; then
+        value="${_GITMOVE_ARGS[$key]-}"
+    fi
+    case "$value" in
+        @branch)
+            __gitmove_branches "${cur}"
+            ;;
+        @file)
+            mapfile -t COMPREPLY < <(compgen -f -- "${cur}")
+            ;;
+        @text)
+            ;;
+        "")
+            mapfile -t COMPREPLY < <(compgen -W "${_GITMOVE_OPTS[$key]-}" -- "${cur}")
+            ;;
+        *)
+            mapfile -t COMPREPLY < <(compgen -W "${value}" -- "${cur}")
+            ;;
+    esac
+    return 0
+}
+
+# Enregistrement de la fonction de complétion
+complete -F _gitmove_completion gitmove
@@ -0,0 +1,171 @@
+# GitMove fish completion
+
+# Branches lues directement dans le dépôt (références non empaquetées et
+# packed-refs), sans lancer git. Code de retour 1 si le dépôt n'a pas la
+# disposition classique (reftable, worktree...) : git doit alors être interrogé.
+function __fish_gitmove_read_branches -a git_dir
+    test -d $git_dir/refs/heads; and not test -e $git_dir/reftable; and not test -e $git_dir/commondir
+    or return 1
+    
+    set -l branches
+    for ref in $git_dir/refs/heads/**
+        test -f $ref; and set -a branches (string replace -- $git_dir/refs/heads/ '' $ref)
+    end
+    if test -r $git_dir/packed-refs
+        set -a branches (string replace -rf '^[0-9a-f]+ refs/heads/' '' < $git_dir/packed-refs)
+    end
+    if set -q branches[1]
+        printf '%s\n' $branches | string match -v -- '*.lock' | sort -u
+    end
+end
+
+# Branches locales, conservées tant que le répertoire et les dates de
+# modification des références (HEAD, packed-refs, refs/heads) sont inchangés.
+# La liste est aussi partagée entre les shells par un fichier de cache de
+# courte durée (2 s) : git n'est lancé qu'une fois par fenêtre de 2 s.
+# Fish rappelle cette fonction à chaque frappe pendant la complétion : tant
+# que la ligne de commande n'a pas changé, la liste est renvoyée telle quelle.
+function __fish_gitmove_branches
+    set -l buffer (commandline -b | string collect)
+    if set -q __fish_gitmove_branches_cache; and test "$__fish_gitmove_branches_buffer" = "$PWD $buffer"
+        printf '%s\n' $__fish_gitmove_branches_cache
+        return 0
+    end
+    if test "$__fish_gitmove_git_dir_pwd" != "$PWD"
+        set -g __fish_gitmove_git_dir (git rev-parse --absolute-git-dir 2>/dev/null)
+        set -g __fish_gitmove_git_dir_pwd $PWD
+    end
+    test -n "$__fish_gitmove_git_dir"; or return 0
+    
+    # Format de date de modification de stat (GNU ou BSD), détecté une fois
+    if not set -q __fish_gitmove_stat_format
+        if stat -c %Y / >/dev/null 2>&1
+            set -g __fish_gitmove_stat_format -c %Y
+        else
+            set -g __fish_gitmove_stat_format -f %m
+        end
+    end
+    
+    set -l refs $__fish_gitmove_git_dir/HEAD $__fish_gitmove_git_dir/packed-refs $__fish_gitmove_git_dir/refs/heads
+    set -l key "$PWD" (stat $__fish_gitmove_stat_format $refs 2>/dev/null)
+    if test "$__fish_gitmove_branches_key" != "$key"
+        set -l cache_home $HOME/.cache
+        set -q XDG_CACHE_HOME; and set cache_home $XDG_CACHE_HOME
+        set -l cache $cache_home/gitmove/branches-(string replace -a / _ -- $__fish_gitmove_git_dir)
+        set -l now (date +%s)
+        
+        # Fichier de cache : date d'écriture, clé des références, branches
+        set -l lines
+        if test -r $cache
+            while read -l line
+                set -a lines $line
+            end < $cache
+        end
+        
+        if test (count $lines) -ge 2; and test "$lines[2]" = "$key"; and test (math "$lines[1] + 2") -gt $now
+            set -g __fish_gitmove_branches_cache $lines[3..-1]
+        else
+            set -g __fish_gitmove_branches_cache (__fish_gitmove_read_branches $__fish_gitmove_git_dir
+                or git for-each-ref --format="%(refname:short)" refs/heads 2>/dev/null)
+            mkdir -p (dirname $cache) 2>/dev/null
+            and printf '%s\n' $now "$key" $__fish_gitmove_branches_cache > $cache.$fish_pid 2>/dev/null
+            and mv -f $cache.$fish_pid $cache 2>/dev/null
+        end
+        set -g __fish_gitmove_branches_key "$key"
+    end
+    set -g __fish_gitmove_branches_buffer "$PWD $buffer"
+    printf '%s\n' $__fish_gitmove_branches_cache
+end
+
+function __fish_gitmove_needs_command
+    set -l cmd (commandline -opc)
+    if [ (count $cmd) -eq 1 ]
+        return 0
+    end
+    return 1
+end
+
+function __fish_gitmove_using_command
+    set -l cmd (commandline -opc)
+    if [ (count $cmd) -gt 1 ]
+        if [ $argv[1] = $cmd[2] ]
+            return 0
+        end
+    end
+    return 1
+end
+
+function __fish_gitmove_using_subcommand
+    set -l cmd (commandline -opc)
+    if [ (count $cmd) -gt 2 ]
+        if [ $argv[1] = $cmd[2] -a $argv[2] = $cmd[3] ]
+            return 0
+        end
+    end
+    return 1
+end
+
+# Commandes principales
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "clean" -d "Nettoie les branches fusionnées"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "sync" -d "Synchronise la branche courante avec la principale"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "advice" -d "Suggère une stratégie pour fusionner/rebaser"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "check-conflicts" -d "Détecte les conflits potentiels"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "init" -d "Initialise la configuration de gitmove pour le dépôt"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "status" -d "Affiche l'état actuel des branches et recommandations"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "config" -d "Commandes de gestion de configuration"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "cicd" -d "Commandes de gestion CI/CD"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "env" -d "Commandes de gestion des variables d'environnement"
+complete -f -c gitmove -n "__fish_gitmove_needs_command" -a "detect-ci" -d "Détecte l'environnement CI courant"
+
+# Options globales
+complete -c gitmove -l verbose -s v -d "Affiche des informations détaillées" -f
+complete -c gitmove -l quiet -s q -d "Minimise les sorties" -f
+complete -c gitmove -l config -s c -d "Spécifie un fichier de configuration alternatif" -r
+complete -c gitmove -l help -s h -d "Affiche l'aide" -f
+complete -c gitmove -l version -d "Affiche la version" -f
+
+# Options pour 'clean'
+complete -c gitmove -n "__fish_gitmove_using_command clean" -l remote -d "Nettoie également les branches distantes" -f
+complete -c gitmove -n "__fish_gitmove_using_command clean" -l dry-run -d "Simule l'opération sans effectuer de changements" -f
+complete -c gitmove -n "__fish_gitmove_using_command clean" -l force -s f -d "Ne pas demander de confirmation" -f
+complete -c gitmove -n "__fish_gitmove_using_command clean" -l exclude -d "Branches à exclure du nettoyage" -x -a "(__fish_gitmove_branches)"
+
+# Options pour 'sync'
+complete -c gitmove -n "__fish_gitmove_using_command sync" -l strategy -d "Stratégie de synchronisation à utiliser" -x -a "merge rebase auto"
+complete -c gitmove -n "__fish_gitmove_using_command sync" -l branch -d "Branche à synchroniser" -x -a "(__fish_gitmove_branches)"
+
+# Options pour 'advice'
+complete -c gitmove -n "__fish_gitmove_using_command advice" -l branch -d "Branche à analyser" -x -a "(__fish_gitmove_branches)"
+complete -c gitmove -n "__fish_gitmove_using_command advice" -l target -d "Branche cible" -x -a "(__fish_gitmove_branches)"
+
+# Options pour 'check-conflicts'
+complete -c gitmove -n "__fish_gitmove_using_command check-conflicts" -l branch -d "Branche à vérifier" -x -a "(__fish_gitmove_branches)"
+complete -c gitmove -n "__fish_gitmove_using_command check-conflicts" -l target -d "Branche cible" -x -a "(__fish_gitmove_branches)"
+
+# Options pour 'init'
+complete -c gitmove -n "__fish_gitmove_using_command init" -l config -d "Chemin vers un fichier de configuration à utiliser comme base" -r
+
+# Options pour 'status'
+complete -c gitmove -n "__fish_gitmove_using_command status" -l detailed -d "Affiche des informations détaillées" -f
+
+# Options pour 'config'
+complete -f -c gitmove -n "__fish_gitmove_using_command config" -a "generate" -d "Génère un exemple de fichier de configuration"
+complete -f -c gitmove -n "__fish_gitmove_using_command config" -a "validate" -d "Valide le fichier de configuration"
+complete -c gitmove -n "__fish_gitmove_using_subcommand config generate" -l output -s o -d "Chemin de sortie pour l'exemple de configuration" -r
+complete -c gitmove -n "__fish_gitmove_using_subcommand config validate" -l config -s c -d "Chemin du fichier de configuration" -r
+
+# Options pour 'cicd'
+complete -f -c gitmove -n "__fish_gitmove_using_command cicd" -a "generate-workflow" -d "Génère un workflow CI/CD"
+complete -f -c gitmove -n "__fish_gitmove_using_command cicd" -a "validate-branch" -d "Valide un nom de branche"
+complete -f -c gitmove -n "__fish_gitmove_using_command cicd" -a "workflow-report" -d "Génère un rapport sur les workflows"
+complete -c gitmove -n "__fish_gitmove_using_subcommand cicd generate-workflow" -l platform -d "Plateforme CI/CD cible" -x -a "github_actions gitlab_ci jenkins travis_ci circleci"
+complete -c gitmove -n "__fish_gitmove_using_subcommand cicd generate-workflow" -l output -s o -d "Chemin de sortie pour le fichier de workflow" -r
+complete -c gitmove -n "__fish_gitmove_using_subcommand cicd validate-branch" -f -a "(__fish_gitmove_branches)"
+complete -c gitmove -n "__fish_gitmove_using_subcommand cicd workflow-report" -l output -s o -d "Chemin de sortie pour le rapport" -r
+
+# Options pour 'env'
+complete -f -c gitmove -n "__fish_gitmove_using_command env" -a "generate-template" -d "Génère un modèle de variables d'environnement"
+complete -f -c gitmove -n "__fish_gitmove_using_command env" -a "validate" -d "Valide les variables d'environnement"
+complete -f -c gitmove -n "__fish_gitmove_using_command env" -a "list" -d "Liste les variables d'environnement GitMove"
+complete -c gitmove -n "__fish_gitmove_using_subcommand env generate-template" -l output -s o -d "Chemin de sortie pour le modèle" -r
+complete -c gitmove -n "__fish_gitmove_using_subcommand env validate" -l prefix -d "Préfixe des variables d'environnement" -x
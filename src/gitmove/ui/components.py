@@ -12,6 +12,7 @@ pour une meilleure expérience utilisateur, notamment:
 import os
 import time
 import threading
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Callable, Tuple, Union
 
 from rich.console import Console
@@ -25,6 +26,11 @@ from rich.syntax import Syntax
 from rich.box import Box, ROUNDED, HEAVY, SIMPLE
 from rich.prompt import Confirm
 
+# Fréquence maximale de rafraîchissement d'une tâche (30 Hz) et avancement
+# minimal (en points de pourcentage) déclenchant un rafraîchissement immédiat
+_PROGRESS_FLUSH_INTERVAL = 1 / 30
+_PROGRESS_FLUSH_ADVANCE = 1.0
+
 class ProgressManager:
     """
     Gestionnaire de barres de progression pour les opérations longues.
@@ -44,6 +50,9 @@ class ProgressManager:
         self.progress = None
         self.active = False
         self.tasks = {}
+        # Avancements non encore transmis à Rich et date du dernier envoi, par tâche
+        self._pending = defaultdict(float)
+        self._last_flush = defaultdict(float)
     
     def start_progress(self, tasks: Optional[List[str]] = None) -> Dict[str, TaskID]:
         """
@@ -66,6 +75,8 @@ class ProgressManager:
         )
         
         task_ids = {}
+        self._pending.clear()
+        self._last_flush.clear()
         
         if tasks:
             with self.progress:
@@ -88,6 +99,10 @@ class ProgressManager:
         """
         Met à jour la progression d'une tâche.
         
+        Les avancements sont cumulés et transmis à Rich au plus 30 fois par
+        seconde, ou dès qu'un point de pourcentage est atteint ; un changement
+        de statut est toujours affiché immédiatement.
+        
         Args:
             task_name: Nom de la tâche à mettre à jour
             advance: Valeur de progression à ajouter
@@ -97,11 +112,30 @@ class ProgressManager:
             return
             
         task_id = self.tasks.get(task_name)
-        if task_id is not None:
-            if status:
-                self.progress.update(task_id, description=f"{task_name} - {status}", advance=advance)
-            else:
+        if task_id is None:
+            return
+        
+        self._pending[task_name] += advance
+        now = time.monotonic()
+        if (status is None
+                and self._pending[task_name] < _PROGRESS_FLUSH_ADVANCE
+                and now - self._last_flush[task_name] < _PROGRESS_FLUSH_INTERVAL):
+            return
+        
+        if status:
+            self.progress.update(task_id, description=f"{task_name} - {status}", advance=self._pending[task_name])
+        else:
+            self.progress.update(task_id, advance=self._pending[task_name])
+        self._pending[task_name] = 0.0
+        self._last_flush[task_name] = now
+    
+    def _flush_pending(self):
+        """Transmet à Rich les avancements encore en attente."""
+        for task_name, advance in self._pending.items():
+            task_id = self.tasks.get(task_name)
+            if advance and task_id is not None:
                 self.progress.update(task_id, advance=advance)
+        self._pending.clear()
     
     def finish_progress(self, task_name: Optional[str] = None):
         """
@@ -116,9 +150,11 @@ class ProgressManager:
         if task_name:
             task_id = self.tasks.get(task_name)
             if task_id is not None:
+                self._pending.pop(task_name, None)
                 self.progress.update(task_id, completed=100)
         else:
             # Terminer toutes les tâches
+            self._pending.clear()
             for task_id in self.tasks.values():
                 self.progress.update(task_id, completed=100)
                 
@@ -148,6 +184,7 @@ class ProgressManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Sortie du gestionnaire de contexte."""
         if self.progress:
+            self._flush_pending()
             self.progress.__exit__(exc_type, exc_val, exc_tb)
             self.active = False
 
@@ -13,6 +13,9 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+# ${ENV_VAR} or $ENV_VAR reference inside a configuration string
+_ENV_VAR_REF_RE = re.compile(r'\$\{?(\w+)\}?')
+
 class ConfigValidator:
     """
     Standardized configuration validator for GitMove.
@@ -192,14 +195,18 @@ class ConfigValidator:
         Returns:
             Configuration with environment variables expanded
         """
+        environ = os.environ
+        
+        def _expand(match):
+            return environ.get(match.group(1), match.group(0))
+        
         def _interpolate(value):
             if isinstance(value, str):
-                # Replace ${ENV_VAR} or $ENV_VAR with environment variable
-                return re.sub(
-                    r'\$\{?(\w+)\}?', 
-                    lambda m: os.environ.get(m.group(1), m.group(0)), 
-                    value
-                )
+                # Replace ${ENV_VAR} or $ENV_VAR with environment variable;
+                # most values reference none and are returned as is
+                if '$' not in value:
+                    return value
+                return _ENV_VAR_REF_RE.sub(_expand, value)
             elif isinstance(value, dict):
                 return {k: _interpolate(v) for k, v in value.items()}
             elif isinstance(value, list):
@@ -208,15 +215,21 @@ class ConfigValidator:
         
         return _interpolate(config)
     
-    def validate_config(self, config: Optional[Dict] = None) -> Dict:
+    def validate_config(
+        self,
+        config: Optional[Dict] = None,
+        with_warnings: bool = False
+    ) -> Union[Dict, Tuple[Dict, List[str]]]:
         """
         Validate configuration against predefined schema.
         
         Args:
             config: Configuration dictionary to validate
+            with_warnings: Also return the validation warnings
         
         Returns:
-            Validated and normalized configuration
+            Validated and normalized configuration, or a tuple
+            (configuration, warnings) if ``with_warnings`` is true
         """
         if config is None:
             config = self._load_config()
@@ -322,6 +335,8 @@ class ConfigValidator:
         elif warnings:
             self._display_validation_results([], warnings)
         
+        if with_warnings:
+            return normalized_config, warnings
         return normalized_config
     
     def _display_validation_results(self, errors: List[str], warnings: List[str]):
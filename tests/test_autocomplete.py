@@ -0,0 +1,128 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Ajouter le répertoire src au path pour pouvoir importer les modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from gitmove.ui.autocomplete import (
+    SuggestionEngine,
+    _SUGGESTIONS_TTL,
+    _compute_suggestions,
+    generate_bash_completion,
+    generate_zsh_completion,
+    generate_fish_completion,
+    _write_file_atomically,
+)
+from gitmove.ui.completion_schema import render_bash, render_zsh, render_fish
+
+class TestSuggestionEngine(unittest.TestCase):
+    """
+    Tests unitaires pour le moteur de suggestions.
+    """
+
+    def setUp(self):
+        """Initialiser les tests"""
+        self.engine = SuggestionEngine()
+        self.context = {
+            'repo_state': {
+                'current_branch': 'feature/test',
+                'is_clean': True,
+                'ahead_commits': 2,
+                'behind_commits': 3,
+            },
+            'merged_branches_count': 1,
+        }
+
+    def test_get_suggestions_repeated_calls(self):
+        """Tester que les appels répétés (servis par le cache) fonctionnent"""
+        first = self.engine.get_suggestions(self.context)
+        second = self.engine.get_suggestions(self.context)
+
+        self.assertEqual(first, second)
+        self.assertEqual(
+            [s['command'] for s in first],
+            ['gitmove clean', 'gitmove sync', 'gitmove check-conflicts',
+             'gitmove advice', 'gitmove status --detailed']
+        )
+
+    def test_get_suggestions_after_cache_expiry(self):
+        """Tester que les suggestions sont recalculées après expiration du cache"""
+        with patch('gitmove.ui.autocomplete.time.monotonic', return_value=0):
+            first = self.engine.get_suggestions(self.context)
+            misses = _compute_suggestions.cache_info().misses
+            self.engine.get_suggestions(self.context)
+            self.assertEqual(_compute_suggestions.cache_info().misses, misses)
+        with patch('gitmove.ui.autocomplete.time.monotonic', return_value=_SUGGESTIONS_TTL):
+            second = self.engine.get_suggestions(self.context)
+
+        self.assertEqual(_compute_suggestions.cache_info().misses, misses + 1)
+        self.assertEqual(first, second)
+
+    def test_get_suggestions_with_providers(self):
+        """Tester que les valeurs peuvent être fournies par des fonctions"""
+        lazy_context = {
+            'repo_state': {
+                'current_branch': 'feature/test',
+                'ahead_commits': lambda: 2,
+                'behind_commits': lambda: 3,
+            },
+            'merged_branches_count': lambda: 1,
+        }
+
+        self.assertEqual(
+            self.engine.get_suggestions(lazy_context),
+            self.engine.get_suggestions(self.context)
+        )
+
+    def test_get_suggestions_follow_provider_values(self):
+        """Tester que le cache suit les valeurs renvoyées par une fonction"""
+        merged_branches = [0]
+        lazy_context = dict(self.context, merged_branches_count=lambda: merged_branches[0])
+
+        with patch('gitmove.ui.autocomplete.time.monotonic', return_value=0):
+            before = self.engine.get_suggestions(lazy_context)
+            merged_branches[0] = 5
+            after = self.engine.get_suggestions(lazy_context)
+
+        self.assertNotIn('gitmove clean', [s['command'] for s in before])
+        self.assertEqual(after[0]['command'], 'gitmove clean')
+        self.assertIn('5', after[0]['description'])
+
+    def test_get_suggestions_empty_context(self):
+        """Tester les suggestions sans informations sur le dépôt"""
+        suggestions = self.engine.get_suggestions({})
+
+        self.assertEqual([s['command'] for s in suggestions], ['gitmove status --detailed'])
+
+class TestCompletionScripts(unittest.TestCase):
+    """
+    Tests unitaires pour les scripts d'auto-complétion.
+    """
+
+    def test_completion_scripts_are_loaded(self):
+        """Tester que les scripts livrés avec le package sont chargés"""
+        self.assertIn("complete -F _gitmove_completion gitmove", generate_bash_completion())
+        self.assertIn("#compdef gitmove", generate_zsh_completion())
+        self.assertIn("complete -f -c gitmove", generate_fish_completion())
+
+    def test_completion_scripts_match_schema(self):
+        """Tester que les scripts livrés sont à jour avec le schéma des commandes"""
+        self.assertEqual(generate_bash_completion(), render_bash())
+        self.assertEqual(generate_zsh_completion(), render_zsh())
+        self.assertEqual(generate_fish_completion(), render_fish())
+
+    def test_failed_write_leaves_no_temporary_file(self):
+        """Tester qu'une écriture en échec ne laisse pas de fichier temporaire"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "gitmove")
+
+            with self.assertRaises(TypeError):
+                _write_file_atomically(path, None)
+
+            self.assertEqual(os.listdir(directory), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@ from unittest.mock import patch, MagicMock
 # Ajouter le répertoire src au path pour pouvoir importer les modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from gitmove.env_config import EnvConfigManager
+from gitmove.env_config import EnvConfigManager, load_env_config
 
 class TestEnvConfigManager(unittest.TestCase):
     """
@@ -151,7 +151,56 @@ class TestEnvConfigManager(unittest.TestCase):
         # Assert
         self.assertEqual(config["general"]["verbose"], False)
         self.assertEqual(config["general"]["main_branch"], "develop")
-    
+
+    def test_load_config_does_not_modify_base_config(self):
+        """Tester que le chargement ne modifie pas la configuration de base"""
+        # Arrange
+        env_vars = {
+            "GITMOVE_GENERAL_MAIN_BRANCH": "develop"
+        }
+
+        # Act
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = EnvConfigManager.load_config(self.base_config)
+
+        # Assert
+        self.assertEqual(config["general"]["main_branch"], "develop")
+        self.assertEqual(self.base_config["general"]["main_branch"], "main")
+        self.assertNotIn("sync", self.base_config)
+
+    def test_load_config_cache_follows_environment(self):
+        """Tester que le cache est invalidé quand l'environnement change"""
+        # Act
+        with patch.dict(os.environ, {"GITMOVE_TEST_LIST": '["a"]'}, clear=True):
+            first = EnvConfigManager.load_config(self.base_config)
+            first["test"]["list"].append("b")
+            second = EnvConfigManager.load_config(self.base_config)
+
+        with patch.dict(os.environ, {"GITMOVE_TEST_LIST": '["c"]'}, clear=True):
+            third = EnvConfigManager.load_config(self.base_config)
+
+        # Assert
+        self.assertEqual(second["test"]["list"], ["a"])
+        self.assertEqual(third["test"]["list"], ["c"])
+
+    def test_load_config_returns_plain_converted_dict(self):
+        """Tester que la configuration retournée est un dict déjà converti"""
+        # Arrange
+        env_vars = {
+            "GITMOVE_TEST_LIST": '["a"]',
+            "GITMOVE_TEST_INVALID_JSON": '{not json'
+        }
+
+        # Act
+        with patch.dict(os.environ, env_vars, clear=True):
+            EnvConfigManager.invalidate_cache()
+            config = EnvConfigManager.load_config(self.base_config)
+
+        # Assert
+        self.assertIs(type(config), dict)
+        self.assertIs(type(config["test"]), dict)
+        self.assertEqual(config["test"], {"list": ["a"], "invalid_json": "{not json"})
+
     def test_generate_env_template(self):
         """Tester la génération d'un template de variables d'environnement"""
         # Act
@@ -220,7 +269,48 @@ class TestEnvConfigManager(unittest.TestCase):
         # Assert
         self.assertIn('general', errors)
         self.assertEqual(len(errors['general']), 2)
-    
+
+    def test_validate_env_config_does_not_modify_config(self):
+        """Tester que la validation n'ajoute pas de sections à la configuration"""
+        # Arrange
+        config = {
+            'general': {
+                'main_branch': 'develop'
+            }
+        }
+
+        # Act
+        errors = EnvConfigManager.validate_env_config(config)
+
+        # Assert
+        self.assertEqual(errors, {})
+        self.assertEqual(list(config), ['general'])
+
+    def test_validate_env_config_flat_view(self):
+        """Tester la validation à partir de la vue à plat de load_config"""
+        # Arrange
+        env_vars = {
+            "GITMOVE_GENERAL_MAIN_BRANCH": "invalid@branch",
+            "GITMOVE_SYNC_DEFAULT_STRATEGY": "invalid-strategy"
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            config, flat_config = EnvConfigManager.load_config(with_flat=True)
+
+        # Act
+        errors = EnvConfigManager.validate_env_config(config, flat_config=flat_config)
+
+        # Assert
+        self.assertEqual(flat_config["general.main_branch"], "invalid@branch")
+        self.assertEqual(errors, EnvConfigManager.validate_env_config(config))
+        self.assertEqual(len(errors['general']), 1)
+        self.assertEqual(len(errors['sync']), 1)
+
+    def test_has_errors(self):
+        """Tester la détection rapide d'une configuration invalide"""
+        # Assert
+        self.assertFalse(EnvConfigManager.has_errors({'general': {'main_branch': 'develop'}}))
+        self.assertTrue(EnvConfigManager.has_errors({'general': {'main_branch': 'invalid@branch'}}))
+
     def test_validate_env_config_pattern(self):
         """Tester la validation avec une regex de pattern"""
         # Arrange
@@ -362,5 +452,44 @@ class TestEnvConfigManager(unittest.TestCase):
         
         #
 
+    def test_load_env_config_is_callable(self):
+        """Tester que load_env_config s'appelle comme une fonction du module"""
+        # Act
+        with patch.dict(os.environ, {"GITMOVE_GENERAL_MAIN_BRANCH": "develop"}, clear=True):
+            config = load_env_config(self.base_config)
+
+        # Assert
+        self.assertEqual(config["general"]["main_branch"], "develop")
+
+    def test_load_env_config_follows_referenced_variables(self):
+        """Tester que load_env_config suit les variables référencées par une valeur"""
+        # Act
+        with patch.dict(os.environ, {"GITMOVE_GENERAL_MAIN_BRANCH": "${MYBR}", "MYBR": "one"}, clear=True):
+            first = load_env_config()
+            os.environ["MYBR"] = "two"
+            second = load_env_config()
+
+        # Assert
+        self.assertEqual(first["general"]["main_branch"], "one")
+        self.assertEqual(second["general"]["main_branch"], "two")
+
+    def test_load_env_config_cached_reports_warnings(self):
+        """Tester que les avertissements sont réaffichés pour un résultat en cache"""
+        # Arrange
+        from gitmove.env_config import _get_validator
+        validator = _get_validator()
+
+        # Act
+        with patch.dict(os.environ, {"GITMOVE_GENERAL_UNKNOWN_KEY": "x"}, clear=True), \
+                patch.object(validator, '_display_validation_results') as display:
+            first = load_env_config()
+            second = load_env_config()
+
+        # Assert
+        self.assertEqual(first, second)
+        self.assertEqual(display.call_count, 2)
+        self.assertEqual(display.call_args_list[0], display.call_args_list[1])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,108 @@
+import os
+import sys
+import tempfile
+import textwrap
+import types
+import unittest
+from unittest.mock import patch
+
+# Ajouter le répertoire src au path pour pouvoir importer les modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from gitmove.plugins.manager import PluginManager
+
+
+class TestPluginManager(unittest.TestCase):
+    """
+    Tests unitaires pour le gestionnaire de plugins.
+    """
+
+    def setUp(self):
+        """Initialiser un répertoire de plugins temporaire"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.plugin_dir = self.temp_dir.name
+        self.plugin_path = os.path.join(self.plugin_dir, "sample.py")
+
+    def tearDown(self):
+        """Nettoyer le répertoire et les modules importés"""
+        sys.modules.pop("gitmove_plugins.sample", None)
+        self.temp_dir.cleanup()
+
+    def _write_plugin(self, source, mtime):
+        """Écrire le fichier du plugin avec une date de modification donnée"""
+        with open(self.plugin_path, "w") as f:
+            f.write(textwrap.dedent(source))
+        os.utime(self.plugin_path, ns=(mtime, mtime))
+
+    def test_reload_drops_removed_hook(self):
+        """Tester qu'un hook supprimé du fichier disparaît après reload()"""
+        self._write_plugin("""
+            from gitmove.plugins.manager import hook
+
+            @hook('pre_sync')
+            def a():
+                return 'a'
+
+            @hook('pre_sync')
+            def b():
+                return 'b'
+        """, 1_000_000_000)
+
+        manager = PluginManager(plugin_dir=self.plugin_dir)
+        manager.load_plugins()
+        self.assertEqual(manager.execute_hook('pre_sync'), ['a', 'b'])
+
+        self._write_plugin("""
+            from gitmove.plugins.manager import hook
+
+            @hook('pre_sync')
+            def a():
+                return 'a2'
+        """, 2_000_000_000)
+
+        manager.reload()
+        self.assertEqual(manager.execute_hook('pre_sync'), ['a2'])
+        self.assertNotIn('b', manager.plugins)
+
+        # Un nouveau gestionnaire ne voit pas non plus l'ancien hook
+        sys.modules.pop("gitmove_plugins.sample", None)
+        fresh = PluginManager(plugin_dir=self.plugin_dir)
+        fresh.load_plugins()
+        self.assertEqual(fresh.execute_hook('pre_sync'), ['a2'])
+
+    def test_registers_hook_imported_from_another_module(self):
+        """Tester qu'un hook réexporté depuis un autre module est enregistré"""
+        self._write_plugin("""
+            def reexported():
+                return 'x'
+            reexported._gitmove_hook = 'post_sync'
+        """, 1_000_000_000)
+
+        manager = PluginManager(plugin_dir=self.plugin_dir)
+        manager.load_plugins()
+        self.assertEqual(manager.execute_hook('post_sync'), ['x'])
+
+
+    def test_load_plugins_retries_failed_plugin(self):
+        """Tester qu'un plugin en échec est rechargé à l'appel suivant"""
+        self._write_plugin("""
+            import gitmove_test_missing_dep
+
+            def hooked():
+                return gitmove_test_missing_dep.VALUE
+            hooked._gitmove_hook = 'pre_sync'
+        """, 1_000_000_000)
+
+        manager = PluginManager(plugin_dir=self.plugin_dir)
+        manager.load_plugins()
+        self.assertEqual(manager.execute_hook('pre_sync'), ())
+
+        # La dépendance devient disponible, le répertoire reste inchangé
+        dependency = types.ModuleType("gitmove_test_missing_dep")
+        dependency.VALUE = 'loaded'
+        with patch.dict(sys.modules, {"gitmove_test_missing_dep": dependency}):
+            manager.load_plugins()
+            self.assertEqual(manager.execute_hook('pre_sync'), ['loaded'])
+
+if __name__ == "__main__":
+    unittest.main()